@@ -0,0 +1,607 @@
+"""Benchmarks do módulo salario-calc-2.
+
+Uso:
+    python benchmark_salario-calc-2.py fabrica --threads 1 2 4 8
+    python benchmark_salario-calc-2.py validacao --linhas 50000 --sujas 0.5
+    python benchmark_salario-calc-2.py memoria --tamanho 100000 --top 10
+    python benchmark_salario-calc-2.py estatisticas --tamanho 200000 --alpha 0.01
+    python benchmark_salario-calc-2.py holerites --tamanho 50000 --trabalhadores 1 4 --processos
+    python benchmark_salario-calc-2.py importacao --repeticoes 30 --alvo-ms 5
+    python benchmark_salario-calc-2.py faixas --tamanho 100000 --faixas 20
+    python benchmark_salario-calc-2.py descontos --tamanho 100000
+    python benchmark_salario-calc-2.py eventos --tamanho 20000 --eventos 200000
+    python benchmark_salario-calc-2.py consolidado --tamanho 100000
+    python benchmark_salario-calc-2.py csv --tamanho 200000 --trabalhadores 1 4
+    python benchmark_salario-calc-2.py paridade --tamanho 100000 --exemplos 10
+"""
+import argparse
+import contextlib
+import importlib.util
+import io
+import logging
+import os
+import py_compile
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+UM_CENTAVO = Decimal('0.01')
+
+
+def carregar_modulo(arquivo: str = 'salario-calc-2.py', nome: str = 'funcionarios') -> Any:
+    """Carrega um dos scripts salario-calc-N.py (nomes com hífen) como módulo."""
+    caminho = os.path.join(DIRETORIO, arquivo)
+    spec = importlib.util.spec_from_file_location(nome, caminho)
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[nome] = modulo
+    spec.loader.exec_module(modulo)
+    return modulo
+
+
+def gil_ativo() -> bool:
+    """Indica se o interpretador roda com GIL (False em builds free-threaded)."""
+    verificar = getattr(sys, '_is_gil_enabled', None)
+    return True if verificar is None else verificar()
+
+
+def bench_fabrica(args: argparse.Namespace) -> None:
+    """Throughput de FabricaFuncionario.criar com N threads leitoras.
+
+    Uma thread escritora registra tipos novos durante toda a medição, para
+    exercitar a troca copy-on-write do registro.
+    """
+    modulo = carregar_modulo()
+    fabrica = modulo.FabricaFuncionario
+    linhas = [
+        ('estagiario', 'João Silva', 160, None, None),
+        ('efetivo', 'Maria Souza', 200, None, None),
+        ('vendedor', 'Carlos Lima', 180, '15000.00', None),
+        ('freelancer', 'Ana Costa', 120, None, 4),
+    ]
+
+    class Plugin(modulo.Estagiario):
+        pass
+
+    print(f"Python {sys.version.split()[0]} - GIL {'ativo' if gil_ativo() else 'desativado'}")
+    print(f"{'threads':>8} {'criações/s':>14} {'registros':>10}")
+    for n_threads in args.threads:
+        parar = threading.Event()
+        registros = [0]
+
+        def escritor():
+            while not parar.is_set():
+                fabrica.registrar_tipo(f"plugin_{registros[0] % 64}", Plugin)
+                registros[0] += 1
+                time.sleep(0.001)
+
+        def leitor(contagem: List[int], indice: int):
+            for i in range(args.iteracoes):
+                tipo, nome, horas, vendas, projetos = linhas[i % len(linhas)]
+                fabrica.criar(tipo, nome, horas, vendas=vendas, projetos=projetos)
+            contagem[indice] = args.iteracoes
+
+        contagem = [0] * n_threads
+        leitores = [threading.Thread(target=leitor, args=(contagem, i)) for i in range(n_threads)]
+        thread_escritora = threading.Thread(target=escritor)
+        thread_escritora.start()
+        inicio = time.perf_counter()
+        for t in leitores:
+            t.start()
+        for t in leitores:
+            t.join()
+        duracao = time.perf_counter() - inicio
+        parar.set()
+        thread_escritora.join()
+        print(f"{n_threads:>8} {sum(contagem) / duracao:>14,.0f} {registros[0]:>10}")
+
+
+def linhas_sujas(n: int, fracao_suja: float, semente: int = 42) -> List[dict]:
+    """Gera linhas de entrada para a fábrica com uma fração de valores inválidos."""
+    rng = random.Random(semente)
+    invalidos = [
+        {'horas': -1}, {'horas': 10.5}, {'nome': '   '}, {'vendas': 'abc'},
+        {'projetos': -2}, {'tipo': 'gerente'}, {'vendas': None},
+    ]
+    linhas = []
+    for i in range(n):
+        linha = {'tipo': 'vendedor', 'nome': f'func {i}', 'horas': rng.randint(0, 220),
+                 'vendas': f'{rng.uniform(0, 30000):.2f}'}
+        if rng.random() < fracao_suja:
+            linha.update(rng.choice(invalidos))
+        linhas.append(linha)
+    return linhas
+
+
+def bench_validacao(args: argparse.Namespace) -> None:
+    """Compara criar (exceção + log por linha) com criar_lote (erros estruturados)."""
+    modulo = carregar_modulo()
+    fabrica = modulo.FabricaFuncionario
+    linhas = linhas_sujas(args.linhas, args.sujas)
+
+    # Mantém a formatação dos registros de log, mas descarta a saída
+    raiz = logging.getLogger()
+    raiz.handlers = [logging.StreamHandler(io.StringIO())]
+
+    inicio = time.perf_counter()
+    validos = sum(fabrica.criar(**linha) is not None for linha in linhas)
+    t_criar = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    resultado = fabrica.criar_lote(linhas)
+    t_lote = time.perf_counter() - inicio
+
+    assert validos == len(resultado.funcionarios)
+    print(f"{args.linhas} linhas, {resultado.linhas_invalidas} inválidas")
+    print(f"{'criar':<12} {args.linhas / t_criar:>12,.0f} linhas/s")
+    print(f"{'criar_lote':<12} {args.linhas / t_lote:>12,.0f} linhas/s")
+    print(resultado.resumo())
+
+
+def bench_memoria(args: argparse.Namespace) -> None:
+    """Perfil de memória (tracemalloc) por tipo e por etapa em um roster sintético."""
+    modulo = carregar_modulo()
+    print(modulo.perfilar_memoria(args.tamanho, top=args.top).formatar())
+
+
+def bench_estatisticas(args: argparse.Namespace) -> None:
+    """Estatísticas por tipo: lista ordenada versus EstatisticasSalariais."""
+    modulo = carregar_modulo()
+    funcionarios = modulo.FabricaFuncionario.criar_lote(
+        modulo.gerar_roster_sintetico(args.tamanho)
+    ).funcionarios
+
+    inicio = time.perf_counter()
+    por_tipo = {}
+    for funcionario in funcionarios:
+        por_tipo.setdefault(type(funcionario).__name__, []).append(float(funcionario.salario_total()))
+    exatos = {}
+    for tipo, valores in por_tipo.items():
+        valores.sort()
+        exatos[tipo] = {q: valores[int(q * (len(valores) - 1))] for q in (0.5, 0.9, 0.99)}
+    t_lista = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    resumo = modulo.EstatisticasSalariais(alpha=args.alpha).adicionar_todos(funcionarios).resumo()
+    t_esboco = time.perf_counter() - inicio
+
+    print(f"{'lista ordenada':<16} {args.tamanho / t_lista:>12,.0f} funcionários/s")
+    print(f"{'esboço':<16} {args.tamanho / t_esboco:>12,.0f} funcionários/s")
+    for tipo, estatisticas in resumo.items():
+        erros = [
+            abs(estatisticas[f'p{int(q * 100)}'] - exato) / exato if exato else 0.0
+            for q, exato in exatos[tipo].items()
+        ]
+        print(f"{tipo:<12} erro relativo máximo p50/p90/p99: {max(erros):.4%}")
+
+
+def bench_holerites(args: argparse.Namespace) -> None:
+    """Exportação de holerites para zip, tar e diretórios fragmentados."""
+    modulo = carregar_modulo()
+    funcionarios = modulo.FabricaFuncionario.criar_lote(
+        modulo.gerar_roster_sintetico(args.tamanho)
+    ).funcionarios
+    print(f"{'formato':<10} {'pool':<10} {'trabalhadores':>13} {'holerites/s':>12}")
+    for formato, sufixo in (('zip', '.zip'), ('tar', '.tar'), ('diretorio', '')):
+        for usar_processos in ((False, True) if args.processos else (False,)):
+            for trabalhadores in args.trabalhadores:
+                with tempfile.TemporaryDirectory() as pasta:
+                    inicio = time.perf_counter()
+                    modulo.exportar_holerites(
+                        funcionarios, os.path.join(pasta, 'holerites' + sufixo),
+                        trabalhadores=trabalhadores, usar_processos=usar_processos
+                    )
+                    duracao = time.perf_counter() - inicio
+                pool = 'processos' if usar_processos else 'threads'
+                print(f"{formato:<10} {pool:<10} {trabalhadores:>13} {args.tamanho / duracao:>12,.0f}")
+
+
+def bench_importacao(args: argparse.Namespace) -> None:
+    """Tempo de importação do módulo em processos novos, comparado a uma meta.
+
+    A meta vale para o custo acima do piso (typing + decimal + collections,
+    medidos nos mesmos processos intercalados), não para o tempo absoluto,
+    que depende da máquina.
+    """
+    caminho = os.path.join(DIRETORIO, 'salario-calc-2.py')
+    carregar = (
+        "import importlib.util, sys, time; inicio = time.perf_counter(); "
+        f"spec = importlib.util.spec_from_file_location('funcionarios', {caminho!r}); "
+        "modulo = importlib.util.module_from_spec(spec); spec.loader.exec_module(modulo); "
+        "print(time.perf_counter() - inicio)"
+    )
+    # Workers reais encontram o .pyc pronto; sem ele mediríamos a compilação
+    py_compile.compile(caminho, doraise=True)
+
+    # Piso: as dependências que o módulo importa na carga (typing é usado em
+    # tempo de execução por NamedTuple); não dependem do módulo, então ficam fora da meta
+    piso = (
+        "import time; inicio = time.perf_counter(); import typing, decimal, collections; "
+        "print(time.perf_counter() - inicio)"
+    )
+
+    tempos, tempos_piso = [], []
+    for _ in range(args.repeticoes):
+        for codigo, destino in ((carregar, tempos), (piso, tempos_piso)):
+            saida = subprocess.run(
+                [sys.executable, '-c', codigo],
+                capture_output=True, text=True, check=True, cwd=tempfile.gettempdir()
+            )
+            destino.append(float(saida.stdout) * 1000)
+    custo = statistics.median(tempos)
+    custo_piso = statistics.median(tempos_piso)
+    excedente = custo - custo_piso
+    print(f"importação (mediana de {args.repeticoes} processos): {custo:.1f} ms")
+    print(f"piso (typing + decimal + collections): {custo_piso:.1f} ms")
+    print(f"custo do módulo acima do piso: {excedente:.1f} ms (meta: {args.alvo_ms:.1f} ms)")
+
+    saida = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', carregar],
+        capture_output=True, text=True, check=True, cwd=tempfile.gettempdir()
+    ).stderr.splitlines()
+    linhas = [linha.split('|') for linha in saida if linha.startswith('import time:') and 'self' not in linha]
+    linhas.sort(key=lambda campos: int(campos[1]), reverse=True)
+    print("Módulos mais caros (acumulado, us):")
+    for campos in linhas[:args.top]:
+        print(f"  {int(campos[1]):>8}  {campos[2].strip()}")
+
+    if excedente > args.alvo_ms:
+        sys.exit(f"Meta de importação excedida: {excedente:.1f} ms acima do piso > {args.alvo_ms:.1f} ms")
+
+
+def bench_faixas(args: argparse.Namespace) -> None:
+    """Salário de vendedores: regras fixas versus tabela com N faixas."""
+    modulo = carregar_modulo()
+    faixas = modulo.TabelaFaixas(
+        [(i * 5000, f"0.{i + 1:02d}") for i in range(args.faixas)]
+    )
+    bonus = modulo.TabelaFaixas([(i * 5000, i * 100) for i in range(1, args.faixas + 1)], progressiva=False)
+
+    class VendedorFaixas(modulo.Vendedor):
+        FAIXAS_COMISSAO = faixas
+        FAIXAS_BONUS_VENDAS = bonus
+
+    rng = random.Random(42)
+    vendas = [f"{rng.uniform(0, args.faixas * 5000 * 1.2):.2f}" for _ in range(args.tamanho)]
+    fixos = [modulo.Vendedor('Carlos Lima', 160, v) for v in vendas]
+    escalonados = [VendedorFaixas('Carlos Lima', 160, v) for v in vendas]
+
+    def medir(rotulo, funcao):
+        inicio = time.perf_counter()
+        funcao()
+        print(f"{rotulo:<28} {args.tamanho / (time.perf_counter() - inicio):>12,.0f} /s")
+
+    medir('salario_total fixo', lambda: [f.salario_total() for f in fixos])
+    medir(f'salario_total {args.faixas} faixas', lambda: [f.salario_total() for f in escalonados])
+    valores = [f.vendas for f in escalonados]
+    colunas = {'nome': [f.nome for f in fixos], 'horas': [f.horas for f in fixos],
+               'ferias': [f.ferias for f in fixos], 'vendas': valores}
+    medir('salario_total_lote fixo', lambda: modulo.Vendedor.salario_total_lote(colunas))
+    medir(f'salario_total_lote {args.faixas} faixas', lambda: VendedorFaixas.salario_total_lote(colunas))
+    medir('comissão escalar', lambda: [faixas.aplicar(v) for v in valores])
+    medir('comissão em lote', lambda: faixas.aplicar_lote(valores))
+
+
+def bench_descontos(args: argparse.Namespace) -> None:
+    """Pipeline de descontos: passada por funcionário versus lote."""
+    modulo = carregar_modulo()
+    # Tabelas de 2024, apenas como carga representativa
+    pipeline = modulo.DescontosFolha([
+        modulo.ContribuicaoProgressiva("INSS", modulo.TabelaFaixas(
+            [(0, '0.075'), ('1412.00', '0.09'), ('2666.68', '0.12'), ('4000.03', '0.14')]
+        ), teto='7786.02'),
+        modulo.DeducaoDependentes('189.59'),
+        modulo.ImpostoProgressivo("IRRF", modulo.TabelaFaixas(
+            [(0, 0), ('2259.20', '0.075'), ('2826.65', '0.15'), ('3751.05', '0.225'), ('4664.68', '0.275')]
+        )),
+        modulo.DescontoFixo("Plano de saúde", '150.00'),
+    ])
+    funcionarios = modulo.FabricaFuncionario.criar_lote(
+        modulo.gerar_roster_sintetico(args.tamanho)
+    ).funcionarios
+    dependentes = [i % 4 for i in range(len(funcionarios))]
+
+    inicio = time.perf_counter()
+    brutos = [f.salario_total() for f in funcionarios]
+    t_bruto = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    por_funcionario = [pipeline.calcular(f, d) for f, d in zip(funcionarios, dependentes)]
+    t_escalar = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    lote = pipeline.calcular_lote(funcionarios, dependentes)
+    t_lote = time.perf_counter() - inicio
+
+    assert lote == por_funcionario and len(brutos) == len(lote)
+    for rotulo, duracao in (('só salario_total', t_bruto), ('bruto + descontos', t_escalar),
+                            ('bruto + descontos (lote)', t_lote)):
+        print(f"{rotulo:<26} {args.tamanho / duracao:>12,.0f} funcionários/s")
+
+
+def bench_eventos(args: argparse.Namespace) -> None:
+    """Folha incremental: eventos/s lendo um JSONL, versus recalcular a folha inteira."""
+    import json
+    modulo = carregar_modulo()
+    linhas = modulo.gerar_roster_sintetico(args.tamanho)
+    folha = modulo.FolhaIncremental(modulo.FabricaFuncionario.criar_lote(linhas).funcionarios)
+    nomes = [(f.nome, type(f).__name__) for f in folha.funcionarios.values()]
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, 'eventos.jsonl')
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            for _ in range(args.eventos):
+                nome, tipo = rng.choice(nomes)
+                if tipo == 'Vendedor':
+                    evento = {'evento': 'vendas', 'nome': nome, 'vendas': f"{rng.uniform(0, 500):.2f}"}
+                elif tipo == 'Freelancer':
+                    evento = {'evento': 'projeto', 'nome': nome}
+                else:
+                    evento = {'evento': 'horas', 'nome': nome, 'horas': rng.randint(1, 8)}
+                arquivo.write(json.dumps(evento) + '\n')
+
+        snapshots = []
+        inicio = time.perf_counter()
+        modulo.acompanhar_eventos(caminho, folha, snapshots.append, seguir=False)
+        t_incremental = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    sum(f.salario_total() for f in folha.funcionarios.values())
+    t_completo = time.perf_counter() - inicio
+
+    print(f"incremental: {args.eventos / t_incremental:>12,.0f} eventos/s "
+          f"({snapshots[-1]['eventos_aplicados']} aplicados, {snapshots[-1]['erros']} erros)")
+    print(f"recalcular a folha de {args.tamanho} funcionários: {t_completo * 1000:.1f} ms por evento")
+
+
+def bench_consolidado(args: argparse.Namespace) -> None:
+    """Resumo por tipo: RelatorioJSON por funcionário + pós-processamento versus RelatorioConsolidado."""
+    import json
+    modulo = carregar_modulo()
+    linhas = modulo.gerar_roster_sintetico(args.tamanho)
+
+    inicio = time.perf_counter()
+    funcionarios = modulo.FabricaFuncionario.criar_lote(linhas).funcionarios
+    relatorio = modulo.RelatorioJSON()
+    totais = {}
+    for dados in (json.loads(relatorio.gerar(f)) for f in funcionarios):
+        totais[dados['tipo']] = totais.get(dados['tipo'], 0.0) + dados['salario_total']
+    t_json = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    modulo.RelatorioConsolidado(formato='json').gerar_consolidado(
+        modulo.FabricaFuncionario.criar(**linha) for linha in linhas
+    )
+    t_consolidado = time.perf_counter() - inicio
+
+    print(f"{'RelatorioJSON + soma':<24} {args.tamanho / t_json:>12,.0f} funcionários/s")
+    print(f"{'RelatorioConsolidado':<24} {args.tamanho / t_consolidado:>12,.0f} funcionários/s")
+
+
+def bench_csv(args: argparse.Namespace) -> None:
+    """Carga de CSV: csv.DictReader + FabricaFuncionario.criar versus carregar_csv_colunar."""
+    import csv
+    modulo = carregar_modulo()
+    linhas = modulo.gerar_roster_sintetico(args.tamanho)
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, 'roster.csv')
+        with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(['tipo', 'nome', 'horas', 'vendas', 'projetos', 'ferias'])
+            for linha in linhas:
+                escritor.writerow([linha['tipo'], linha['nome'], linha['horas'], linha.get('vendas', ''),
+                                   linha.get('projetos', ''), int(linha['ferias'])])
+
+        def converter(linha):
+            dados = {'tipo': linha['tipo'], 'nome': linha['nome'], 'horas': int(linha['horas']),
+                     'ferias': linha['ferias'] == '1'}
+            if linha['vendas']:
+                dados['vendas'] = linha['vendas']
+            if linha['projetos']:
+                dados['projetos'] = int(linha['projetos'])
+            return dados
+
+        inicio = time.perf_counter()
+        with open(caminho, encoding='utf-8', newline='') as arquivo:
+            total_objetos = sum(
+                modulo.FabricaFuncionario.criar(**converter(linha)).salario_total()
+                for linha in csv.DictReader(arquivo)
+            )
+        t_objetos = time.perf_counter() - inicio
+        print(f"{'DictReader + criar':<28} {args.tamanho / t_objetos:>12,.0f} linhas/s")
+
+        for trabalhadores in args.trabalhadores:
+            inicio = time.perf_counter()
+            resultado = modulo.carregar_csv_colunar(caminho, trabalhadores=trabalhadores,
+                                                    tamanho_bloco=args.bloco_mb << 20)
+            total_colunar = sum(resultado.roster.salarios_totais())
+            t_colunar = time.perf_counter() - inicio
+            assert total_colunar == total_objetos, (total_colunar, total_objetos)
+            rotulo = f"colunar ({trabalhadores} proc.)"
+            print(f"{rotulo:<28} {args.tamanho / t_colunar:>12,.0f} linhas/s")
+
+
+def _centavos_float(valor: float) -> Decimal:
+    """Valor em centavos como as versões em float o exibem (``:.2f``, como o RelatorioSalario)."""
+    return Decimal(f"{valor:.2f}")
+
+
+def implementacoes_paridade() -> List[Tuple[str, Callable[[List[Dict[str, Any]]], List[Decimal]]]]:
+    """Todas as implementações do salário total, da referência às de lote.
+
+    Cada uma recebe as linhas no formato de ``FabricaFuncionario.criar`` e
+    devolve o salário total de cada linha em centavos. A primeira (v2 escalar)
+    é a referência.
+    """
+    v0 = carregar_modulo('salario-calc-0.py', 'salario_calc_0')
+    v1 = carregar_modulo('salario-calc-1.py', 'salario_calc_1')
+    v2 = carregar_modulo()
+
+    def v2_escalar(linhas):
+        return [v2.FabricaFuncionario.criar(**linha).salario_total() for linha in linhas]
+
+    def v2_criar_lote(linhas):
+        return [f.salario_total() for f in v2.FabricaFuncionario.criar_lote(linhas).funcionarios]
+
+    def v2_colunar(linhas):
+        roster = v2.RosterColunar()
+        for linha in linhas:
+            vendas = linha.get('vendas')
+            roster.anexar(linha['tipo'], linha['nome'], linha['horas'], linha['ferias'],
+                          None if vendas is None else Decimal(vendas), linha.get('projetos'))
+        return roster.salarios_totais()
+
+    def v1_criador(linhas):
+        criar = v1.CriadorFuncionarios.criar
+        return [
+            _centavos_float(criar(linha['tipo'], linha['nome'], linha['horas'],
+                                  float(linha['vendas']) if 'vendas' in linha else None,
+                                  linha.get('projetos'), linha['ferias']).salario_total())
+            for linha in linhas
+        ]
+
+    def v0_calc_salario(linhas):
+        # calc_salario só imprime; o salário é lido da linha "Salário final:"
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(saida):
+            for linha in linhas:
+                v0.calc_salario(linha['nome'], linha['tipo'], linha['horas'], float(linha.get('vendas', 0)),
+                                linha.get('projetos', 0), linha['ferias'])
+        return [
+            _centavos_float(float(texto.rsplit(':', 1)[1]))
+            for texto in saida.getvalue().splitlines() if texto.startswith('Salário final:')
+        ]
+
+    return [
+        ('v2 FabricaFuncionario.criar', v2_escalar),
+        ('v2 criar_lote', v2_criar_lote),
+        ('v2 RosterColunar', v2_colunar),
+        ('v1 CriadorFuncionarios', v1_criador),
+        ('v0 calc_salario', v0_calc_salario),
+    ]
+
+
+def bench_paridade(args: argparse.Namespace) -> None:
+    """Paridade ao centavo e throughput de v0, v1, v2 e dos motores de lote da v2.
+
+    Roda um roster aleatório mais os casos limite em todas as implementações e
+    compara cada salário com a referência (v2 escalar, ``ROUND_HALF_UP``).
+    Divergências de até um centavo contam como arredondamento (float exibido
+    com ``:.2f``); as maiores, como diferença de regra. As de v0/v1 são apenas
+    reportadas; qualquer divergência de um motor da v2 encerra com código 1.
+    """
+    implementacoes = implementacoes_paridade()
+    modulo = sys.modules['funcionarios']
+    linhas = modulo.gerar_roster_casos_limite() + modulo.gerar_roster_sintetico(args.tamanho, args.semente)
+
+    resultados = []
+    for rotulo, implementacao in implementacoes:
+        inicio = time.perf_counter()
+        salarios = implementacao(linhas)
+        resultados.append((rotulo, salarios, time.perf_counter() - inicio))
+    referencia = resultados[0][1]
+
+    print(f"{'implementação':<30} {'linhas':>8} {'arredond.':>10} {'regra':>8} {'máx. |Δ|':>10} {'linhas/s':>12}")
+    exemplos = []
+    v2_divergente = False
+    for rotulo, salarios, duracao in resultados:
+        if len(salarios) != len(referencia):
+            print(f"{rotulo:<30} {len(salarios):>8} {'linhas perdidas':>19}")
+            v2_divergente |= rotulo.startswith('v2')
+            continue
+        divergencias = [(i, s) for i, (s, r) in enumerate(zip(salarios, referencia)) if s != r]
+        deltas = [abs(s - referencia[i]) for i, s in divergencias]
+        arredondamento = sum(1 for delta in deltas if delta <= UM_CENTAVO)
+        print(f"{rotulo:<30} {len(salarios):>8} {arredondamento:>10} {len(deltas) - arredondamento:>8} "
+              f"{max(deltas, default=Decimal('0.00')):>10} {len(linhas) / duracao:>12,.0f}")
+        exemplos.extend((rotulo, i, s) for i, s in divergencias[:args.exemplos])
+        v2_divergente |= bool(divergencias) and rotulo.startswith('v2')
+
+    for rotulo, i, salario in exemplos:
+        linha = linhas[i]
+        dados = ', '.join(f"{c}={linha[c]}" for c in ('tipo', 'horas', 'vendas', 'projetos', 'ferias') if c in linha)
+        print(f"  {rotulo}: {dados} -> {salario} (referência {referencia[i]})")
+    if v2_divergente:
+        sys.exit(1)
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest='benchmark', required=True)
+
+    p_fabrica = sub.add_parser('fabrica', help=bench_fabrica.__doc__.splitlines()[0])
+    p_fabrica.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    p_fabrica.add_argument('--iteracoes', type=int, default=20000)
+    p_fabrica.set_defaults(func=bench_fabrica)
+
+    p_validacao = sub.add_parser('validacao', help=bench_validacao.__doc__.splitlines()[0])
+    p_validacao.add_argument('--linhas', type=int, default=50000)
+    p_validacao.add_argument('--sujas', type=float, default=0.5, help='fração de linhas inválidas')
+    p_validacao.set_defaults(func=bench_validacao)
+
+    p_memoria = sub.add_parser('memoria', help=bench_memoria.__doc__.splitlines()[0])
+    p_memoria.add_argument('--tamanho', type=int, default=100000)
+    p_memoria.add_argument('--top', type=int, default=10)
+    p_memoria.set_defaults(func=bench_memoria)
+
+    p_estatisticas = sub.add_parser('estatisticas', help=bench_estatisticas.__doc__.splitlines()[0])
+    p_estatisticas.add_argument('--tamanho', type=int, default=200000)
+    p_estatisticas.add_argument('--alpha', type=float, default=0.01)
+    p_estatisticas.set_defaults(func=bench_estatisticas)
+
+    p_holerites = sub.add_parser('holerites', help=bench_holerites.__doc__.splitlines()[0])
+    p_holerites.add_argument('--tamanho', type=int, default=50000)
+    p_holerites.add_argument('--trabalhadores', type=int, nargs='+', default=[1, 4])
+    p_holerites.add_argument('--processos', action='store_true', help='inclui o pool de processos')
+    p_holerites.set_defaults(func=bench_holerites)
+
+    p_importacao = sub.add_parser('importacao', help=bench_importacao.__doc__.splitlines()[0])
+    p_importacao.add_argument('--repeticoes', type=int, default=30)
+    p_importacao.add_argument('--alvo-ms', type=float, default=5.0)
+    p_importacao.add_argument('--top', type=int, default=8)
+    p_importacao.set_defaults(func=bench_importacao)
+
+    p_faixas = sub.add_parser('faixas', help=bench_faixas.__doc__.splitlines()[0])
+    p_faixas.add_argument('--tamanho', type=int, default=100000)
+    p_faixas.add_argument('--faixas', type=int, default=20)
+    p_faixas.set_defaults(func=bench_faixas)
+
+    p_descontos = sub.add_parser('descontos', help=bench_descontos.__doc__.splitlines()[0])
+    p_descontos.add_argument('--tamanho', type=int, default=100000)
+    p_descontos.set_defaults(func=bench_descontos)
+
+    p_eventos = sub.add_parser('eventos', help=bench_eventos.__doc__.splitlines()[0])
+    p_eventos.add_argument('--tamanho', type=int, default=20000)
+    p_eventos.add_argument('--eventos', type=int, default=200000)
+    p_eventos.set_defaults(func=bench_eventos)
+
+    p_consolidado = sub.add_parser('consolidado', help=bench_consolidado.__doc__.splitlines()[0])
+    p_consolidado.add_argument('--tamanho', type=int, default=100000)
+    p_consolidado.set_defaults(func=bench_consolidado)
+
+    p_csv = sub.add_parser('csv', help=bench_csv.__doc__.splitlines()[0])
+    p_csv.add_argument('--tamanho', type=int, default=200000)
+    p_csv.add_argument('--trabalhadores', type=int, nargs='+', default=[1, 4])
+    p_csv.add_argument('--bloco-mb', type=int, default=4)
+    p_csv.set_defaults(func=bench_csv)
+
+    p_paridade = sub.add_parser('paridade', help=bench_paridade.__doc__.splitlines()[0])
+    p_paridade.add_argument('--tamanho', type=int, default=100000)
+    p_paridade.add_argument('--semente', type=int, default=0)
+    p_paridade.add_argument('--exemplos', type=int, default=5, help='divergências listadas por implementação')
+    p_paridade.set_defaults(func=bench_paridade)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
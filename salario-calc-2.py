@@ -1,23 +1,204 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Type, TypeVar
-import logging
-import json
+from typing import (
+    Optional, Dict, Any, Type, TypeVar, Mapping, NamedTuple, Tuple, FrozenSet,
+    Callable, Iterable, List, Sequence
+)
+from bisect import bisect_left
+from collections import Counter
+from itertools import repeat
+from types import MappingProxyType
+import math
+import os
+import threading
 from decimal import Decimal, ROUND_HALF_UP
 
-# Configuração avançada de logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('funcionarios.log'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+# Importar o módulo não tem efeitos colaterais: nada de logging.basicConfig
+# nem arquivo de log aberto. Módulos pouco usados (logging, json, inspect,
+# random, unicodedata, tracemalloc, zipfile...) são importados sob demanda,
+# o que mantém a partida de processos curtos rápida. As anotações não são
+# avaliadas na carga (``from __future__ import annotations``).
+# Meta de importação: ver ``benchmark_salario-calc-2.py importacao``.
+
+
+def configurar_logging(
+    arquivo: Optional[str] = 'funcionarios.log',
+    nivel: int = 20,  # logging.INFO
+    console: bool = True
+) -> None:
+    """Configura o logging da aplicação (arquivo e/ou console).
+
+    Deve ser chamada explicitamente pelo ponto de entrada da aplicação;
+    ``arquivo=None`` desativa o arquivo de log (ex: sistemas somente leitura).
+    """
+    import logging
+    handlers: List[Any] = []
+    if arquivo:
+        handlers.append(logging.FileHandler(arquivo))
+    if console:
+        handlers.append(logging.StreamHandler())
+    logging.basicConfig(
+        level=nivel,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers or [logging.NullHandler()]
+    )
+
+
+def _logger() -> Any:
+    import logging
+    return logging.getLogger(__name__)
+
+
+def __getattr__(nome: str) -> Any:
+    # Mantém ``modulo.logger`` disponível sem importar logging na carga do módulo
+    if nome == 'logger':
+        return _logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
 
 FuncionarioType = TypeVar('FuncionarioType', bound='Funcionario')
 
 
+class ErroValidacao(NamedTuple):
+    """Registro leve de erro de validação, usado no lugar de exceções.
+
+    Attributes:
+        campo (str): Campo que falhou (``''`` quando não se aplica a um campo).
+        codigo (str): Código estável do erro (ex: ``'negativo'``, ``'obrigatorio'``).
+        mensagem (str): Mensagem legível, igual à da ``ValueError`` equivalente.
+    """
+    campo: str
+    codigo: str
+    mensagem: str
+
+
+# Verificadores sem exceção: retornam (valor normalizado, None) ou (None, erro).
+# Os setters usam os mesmos verificadores e convertem o erro em ValueError.
+
+def _verificar_nome(value: Any) -> Tuple[Any, Optional[ErroValidacao]]:
+    if not isinstance(value, str):
+        return None, ErroValidacao('nome', 'nao_string', "Nome deve ser uma string")
+    value_stripped = value.strip()
+    if not value_stripped:
+        return None, ErroValidacao('nome', 'vazio', "Nome não pode ser vazio ou conter apenas espaços")
+    # Converte cada palavra para Title Case
+    return " ".join(word.capitalize() for word in value_stripped.split()), None
+
+
+def _verificar_horas(value: Any) -> Tuple[Any, Optional[ErroValidacao]]:
+    # Permitir float inteiro
+    if isinstance(value, float):
+        if not value.is_integer():
+            return None, ErroValidacao(
+                'horas', 'nao_inteiro', "Horas trabalhadas deve ser inteiro ou float equivalente a inteiro"
+            )
+        value = int(value)
+    if not isinstance(value, int):
+        return None, ErroValidacao('horas', 'nao_inteiro', "Horas trabalhadas deve ser um número inteiro")
+    if value < 0:
+        return None, ErroValidacao('horas', 'negativo', "Horas trabalhadas não podem ser negativas")
+    return value, None
+
+
+def _verificar_vendas(value: Any) -> Tuple[Any, Optional[ErroValidacao]]:
+    try:
+        decimal_val = Decimal(str(value))
+    except Exception:
+        decimal_val = None
+    if decimal_val is None or not decimal_val.is_finite():
+        return None, ErroValidacao('vendas', 'nao_numerico', "Valor de vendas deve ser numérico ou string numérica")
+    if decimal_val < Decimal('0'):
+        return None, ErroValidacao('vendas', 'negativo', "Valor de vendas não pode ser negativo")
+    return decimal_val, None
+
+
+def _verificar_projetos(value: Any) -> Tuple[Any, Optional[ErroValidacao]]:
+    if isinstance(value, float):
+        if not value.is_integer():
+            return None, ErroValidacao('projetos', 'nao_inteiro', "Número de projetos deve ser inteiro")
+        value = int(value)
+    if not isinstance(value, int):
+        return None, ErroValidacao('projetos', 'nao_inteiro', "Número de projetos deve ser inteiro")
+    if value < 0:
+        return None, ErroValidacao('projetos', 'negativo', "Número de projetos não pode ser negativo")
+    return value, None
+
+
+_VERIFICADORES: Dict[str, Callable[[Any], Tuple[Any, Optional[ErroValidacao]]]] = {
+    'nome': _verificar_nome,
+    'horas': _verificar_horas,
+    'vendas': _verificar_vendas,
+    'projetos': _verificar_projetos,
+}
+
+
+class TabelaFaixas:
+    """Tabela ordenada de faixas (limite inferior, valor) com busca binária.
+
+    No modo progressivo (padrão), ``valor`` é uma taxa marginal: cada fatia
+    entre dois limites é multiplicada pela taxa da sua faixa, como em tabelas
+    de comissão escalonada ou tarifas de hora extra. Cada faixa é reduzida a
+    uma reta ``x * taxa + intercepto`` pré-calculada, então ``aplicar`` custa
+    uma busca binária, uma multiplicação e uma soma, qualquer que seja o
+    número de faixas.
+
+    No modo degrau (``progressiva=False``), ``aplicar(x)`` retorna o valor da
+    maior faixa cujo limite é ultrapassado (``x > limite``), como em bônus por
+    meta atingida. Abaixo do primeiro limite o resultado é zero nos dois modos.
+    Entradas que não são Decimal (ex: float) são convertidas como nos limites.
+    """
+
+    def __init__(self, faixas: Iterable[Tuple[Any, Any]], progressiva: bool = True):
+        pares = [(Decimal(str(limite)), Decimal(str(valor))) for limite, valor in faixas]
+        if not pares:
+            raise ValueError("Tabela de faixas não pode ser vazia")
+        if pares[0][0] < 0:
+            raise ValueError("Limites das faixas não podem ser negativos")
+        if any(atual[0] <= anterior[0] for anterior, atual in zip(pares, pares[1:])):
+            raise ValueError("Limites das faixas devem ser estritamente crescentes")
+        self.progressiva = progressiva
+        self.limites: List[Decimal] = [limite for limite, _ in pares]
+        self.valores: List[Decimal] = [valor for _, valor in pares]
+        # acumulado(i) + (x - limite(i)) * taxa(i) == x * taxa(i) + intercepto(i)
+        acumulado = Decimal('0')
+        self._interceptos: List[Decimal] = [acumulado - self.limites[0] * self.valores[0]]
+        for i in range(1, len(pares)):
+            acumulado += (self.limites[i] - self.limites[i - 1]) * self.valores[i - 1]
+            self._interceptos.append(acumulado - self.limites[i] * self.valores[i])
+
+    def aplicar(self, x: Any) -> Decimal:
+        """Aplica a tabela a um único valor em O(log n)."""
+        if not isinstance(x, Decimal):
+            x = Decimal(str(x))
+        i = bisect_left(self.limites, x) - 1
+        if i < 0:
+            return Decimal('0')
+        if self.progressiva:
+            return x * self.valores[i] + self._interceptos[i]
+        return self.valores[i]
+
+    def aplicar_lote(self, xs: Iterable[Any]) -> List[Decimal]:
+        """Aplica a tabela a vários valores de uma vez.
+
+        As buscas são feitas em bloco com ``map`` sobre ``bisect_left``, sem
+        despacho de método por item.
+        """
+        xs = [x if isinstance(x, Decimal) else Decimal(str(x)) for x in xs]
+        indices = map(bisect_left, repeat(self.limites, len(xs)), xs)
+        zero = Decimal('0')
+        valores, interceptos = self.valores, self._interceptos
+        if self.progressiva:
+            return [
+                zero if i == 0 else x * valores[i - 1] + interceptos[i - 1]
+                for i, x in zip(indices, xs)
+            ]
+        return [zero if i == 0 else valores[i - 1] for i in indices]
+
+    def to_list(self) -> List[List[float]]:
+        """Serializa as faixas como ``[[limite, valor], ...]``."""
+        return [[float(limite), float(valor)] for limite, valor in zip(self.limites, self.valores)]
+
+
 class Funcionario(ABC):
     """Classe abstrata base para todos os tipos de funcionários.
 
@@ -41,13 +222,10 @@ class Funcionario(ABC):
 
     @nome.setter
     def nome(self, value: str):
-        if not isinstance(value, str):
-            raise ValueError("Nome deve ser uma string")
-        value_stripped = value.strip()
-        if not value_stripped:
-            raise ValueError("Nome não pode ser vazio ou conter apenas espaços")
-        # Converte cada palavra para Title Case
-        self._nome = " ".join(word.capitalize() for word in value_stripped.split())
+        valor, erro = _verificar_nome(value)
+        if erro:
+            raise ValueError(erro.mensagem)
+        self._nome = valor
 
     @property
     def horas(self) -> int:
@@ -56,16 +234,10 @@ class Funcionario(ABC):
 
     @horas.setter
     def horas(self, value: Any):
-        # Permitir float inteiro
-        if isinstance(value, float):
-            if not value.is_integer():
-                raise ValueError("Horas trabalhadas deve ser inteiro ou float equivalente a inteiro")
-            value = int(value)
-        if not isinstance(value, int):
-            raise ValueError("Horas trabalhadas deve ser um número inteiro")
-        if value < 0:
-            raise ValueError("Horas trabalhadas não podem ser negativas")
-        self._horas = value
+        valor, erro = _verificar_horas(value)
+        if erro:
+            raise ValueError(erro.mensagem)
+        self._horas = valor
 
     @property
     def ferias(self) -> bool:
@@ -118,6 +290,31 @@ class Funcionario(ABC):
         """Método fábrica para criação de instâncias com validação integrada."""
         return cls(nome=nome, horas=horas, ferias=ferias, **dados_extra)
 
+    @classmethod
+    def salario_total_lote(cls, colunas: Mapping[str, Sequence[Any]]) -> List[Decimal]:
+        """Calcula ``salario_total`` de um lote em formato colunar.
+
+        ``colunas`` mapeia cada campo do construtor (``nome``, ``horas``,
+        ``ferias`` e extras como ``vendas``) para uma sequência de valores já
+        validados. Esta implementação genérica cria uma instância por linha;
+        os tipos nativos a sobrescrevem com o cálculo direto sobre as colunas.
+        """
+        extras = [campo for campo in colunas if campo not in ('nome', 'horas', 'ferias')]
+        nomes = colunas.get('nome') or repeat('Lote', len(colunas['horas']))
+        return [
+            cls.criar(
+                nome=nome, horas=horas, ferias=ferias,
+                **{campo: colunas[campo][i] for campo in extras if colunas[campo][i] is not None}
+            ).salario_total()
+            for i, (nome, horas, ferias) in enumerate(zip(nomes, colunas['horas'], colunas['ferias']))
+        ]
+
+    @classmethod
+    def _regras_de(cls, base: Type['Funcionario'], *metodos: str) -> bool:
+        """Indica se ``cls`` herda sem alterações as regras de cálculo de ``base``."""
+        nomes = ('salario_mensal', '_bonus_ferias', 'adicional_ferias', 'salario_total') + metodos
+        return all(getattr(cls, nome) is getattr(base, nome) for nome in nomes)
+
 
 class Estagiario(Funcionario):
     VALOR_HORA = Decimal('10.00')
@@ -135,23 +332,72 @@ class Estagiario(Funcionario):
         data['valor_hora'] = float(self.VALOR_HORA)
         return data
 
+    @classmethod
+    def salario_total_lote(cls, colunas: Mapping[str, Sequence[Any]]) -> List[Decimal]:
+        if not cls._regras_de(Estagiario):
+            return super().salario_total_lote(colunas)
+        valor_hora, bonus, zero = cls.VALOR_HORA, cls.BONUS_FERIAS, Decimal('0.00')
+        return [
+            _centavos(Decimal(horas) * valor_hora + (bonus if ferias else zero))
+            for horas, ferias in zip(colunas['horas'], colunas['ferias'])
+        ]
+
 
 class Efetivo(Funcionario):
     TARIFA_HORA = Decimal('20.00')
     TARIFA_EXTRA = Decimal('25.00')
     HORAS_LIMITE = 180
     BONUS_FERIAS = Decimal('1000.00')
+    # Tarifas progressivas por hora; None usa TARIFA_HORA/TARIFA_EXTRA/HORAS_LIMITE
+    FAIXAS_HORAS: Optional[TabelaFaixas] = None
 
     @property
     def _bonus_ferias(self) -> Decimal:
         return self.BONUS_FERIAS
 
     def salario_mensal(self) -> Decimal:
+        if self.FAIXAS_HORAS is not None:
+            return self.FAIXAS_HORAS.aplicar(self.horas)
         if self.horas <= self.HORAS_LIMITE:
             return Decimal(self.horas) * self.TARIFA_HORA
         extras = Decimal(self.horas - self.HORAS_LIMITE)
         return (Decimal(self.HORAS_LIMITE) * self.TARIFA_HORA) + (extras * self.TARIFA_EXTRA)
 
+    def horas_extras(self) -> Any:
+        """Horas pagas acima da tarifa normal.
+
+        Sem ``FAIXAS_HORAS``, são as horas acima de HORAS_LIMITE. Com a tabela,
+        o limite é o início da primeira faixa com tarifa maior que a da
+        primeira faixa (sem uma faixa assim, não há horas extras); o resultado
+        é ``int`` quando o limite é inteiro.
+        """
+        tabela = self.FAIXAS_HORAS
+        if tabela is None:
+            return max(self.horas - self.HORAS_LIMITE, 0)
+        tarifa_normal = tabela.valores[0]
+        limite = next((l for l, v in zip(tabela.limites, tabela.valores) if v > tarifa_normal), None)
+        if limite is None or self.horas <= limite:
+            return 0
+        extras = self.horas - limite
+        return int(extras) if extras == extras.to_integral_value() else extras
+
+    @classmethod
+    def salario_total_lote(cls, colunas: Mapping[str, Sequence[Any]]) -> List[Decimal]:
+        if not cls._regras_de(Efetivo):
+            return super().salario_total_lote(colunas)
+        bonus, zero = cls.BONUS_FERIAS, Decimal('0.00')
+        horas = colunas['horas']
+        if cls.FAIXAS_HORAS is not None:
+            mensais = cls.FAIXAS_HORAS.aplicar_lote(horas)
+        else:
+            limite, tarifa, extra = cls.HORAS_LIMITE, cls.TARIFA_HORA, cls.TARIFA_EXTRA
+            base_limite = Decimal(limite) * tarifa
+            mensais = [
+                Decimal(h) * tarifa if h <= limite else base_limite + Decimal(h - limite) * extra
+                for h in horas
+            ]
+        return [_centavos(m + (bonus if f else zero)) for m, f in zip(mensais, colunas['ferias'])]
+
     def to_dict(self) -> Dict[str, Any]:
         data = super().to_dict()
         data.update({
@@ -159,6 +405,8 @@ class Efetivo(Funcionario):
             'tarifa_extra': float(self.TARIFA_EXTRA),
             'horas_limite': self.HORAS_LIMITE
         })
+        if self.FAIXAS_HORAS is not None:
+            data['faixas_horas'] = self.FAIXAS_HORAS.to_list()
         return data
 
 
@@ -168,6 +416,9 @@ class Vendedor(Funcionario):
     BONUS_VENDAS = Decimal('500.00')
     LIMITE_BONUS = Decimal('10000.00')
     BONUS_FERIAS = Decimal('800.00')
+    # Tabelas escalonadas; None usa as regras fixas acima
+    FAIXAS_COMISSAO: Optional[TabelaFaixas] = None  # progressiva sobre vendas
+    FAIXAS_BONUS_VENDAS: Optional[TabelaFaixas] = None  # degrau sobre vendas
 
     def __init__(self, nome: str, horas: Any, vendas: Any, ferias: bool = False):
         super().__init__(nome, horas, ferias)
@@ -183,23 +434,51 @@ class Vendedor(Funcionario):
 
     @vendas.setter
     def vendas(self, value: Any):
-        try:
-            decimal_val = Decimal(str(value))
-        except Exception:
-            raise ValueError("Valor de vendas não pode ser convertido para Decimal")
-        if decimal_val < Decimal('0'):
-            raise ValueError("Valor de vendas não pode ser negativo")
-        self._vendas = decimal_val
+        valor, erro = _verificar_vendas(value)
+        if erro:
+            if erro.codigo == 'nao_numerico':
+                raise ValueError("Valor de vendas não pode ser convertido para Decimal")
+            raise ValueError(erro.mensagem)
+        self._vendas = valor
 
     @property
     def _bonus_ferias(self) -> Decimal:
         return self.BONUS_FERIAS
 
+    def comissao(self) -> Decimal:
+        if self.FAIXAS_COMISSAO is not None:
+            return self.FAIXAS_COMISSAO.aplicar(self.vendas)
+        return self.vendas * self.TAXA_COMISSAO
+
+    def bonus_vendas(self) -> Decimal:
+        if self.FAIXAS_BONUS_VENDAS is not None:
+            return self.FAIXAS_BONUS_VENDAS.aplicar(self.vendas)
+        return self.BONUS_VENDAS if self.vendas > self.LIMITE_BONUS else Decimal('0.00')
+
     def salario_mensal(self) -> Decimal:
         base = Decimal(self.horas) * self.TARIFA_HORA
-        comissao = self.vendas * self.TAXA_COMISSAO
-        bonus = self.BONUS_VENDAS if self.vendas > self.LIMITE_BONUS else Decimal('0.00')
-        return base + comissao + bonus
+        return base + self.comissao() + self.bonus_vendas()
+
+    @classmethod
+    def salario_total_lote(cls, colunas: Mapping[str, Sequence[Any]]) -> List[Decimal]:
+        if not cls._regras_de(Vendedor, 'comissao', 'bonus_vendas'):
+            return super().salario_total_lote(colunas)
+        tarifa, bonus_ferias, zero = cls.TARIFA_HORA, cls.BONUS_FERIAS, Decimal('0.00')
+        vendas = colunas['vendas']
+        if cls.FAIXAS_COMISSAO is not None:
+            comissoes = cls.FAIXAS_COMISSAO.aplicar_lote(vendas)
+        else:
+            taxa = cls.TAXA_COMISSAO
+            comissoes = [v * taxa for v in vendas]
+        if cls.FAIXAS_BONUS_VENDAS is not None:
+            bonus = cls.FAIXAS_BONUS_VENDAS.aplicar_lote(vendas)
+        else:
+            limite, valor_bonus = cls.LIMITE_BONUS, cls.BONUS_VENDAS
+            bonus = [valor_bonus if v > limite else zero for v in vendas]
+        return [
+            _centavos(Decimal(h) * tarifa + c + b + (bonus_ferias if f else zero))
+            for h, c, b, f in zip(colunas['horas'], comissoes, bonus, colunas['ferias'])
+        ]
 
     def to_dict(self) -> Dict[str, Any]:
         data = super().to_dict()
@@ -208,6 +487,10 @@ class Vendedor(Funcionario):
             'taxa_comissao': float(self.TAXA_COMISSAO),
             'limite_bonus': float(self.LIMITE_BONUS)
         })
+        if self.FAIXAS_COMISSAO is not None:
+            data['faixas_comissao'] = self.FAIXAS_COMISSAO.to_list()
+        if self.FAIXAS_BONUS_VENDAS is not None:
+            data['faixas_bonus_vendas'] = self.FAIXAS_BONUS_VENDAS.to_list()
         return data
 
 
@@ -228,15 +511,10 @@ class Freelancer(Funcionario):
 
     @projetos.setter
     def projetos(self, value: Any):
-        if isinstance(value, float):
-            if not value.is_integer():
-                raise ValueError("Número de projetos deve ser inteiro")
-            value = int(value)
-        if not isinstance(value, int):
-            raise ValueError("Número de projetos deve ser inteiro")
-        if value < 0:
-            raise ValueError("Número de projetos não pode ser negativo")
-        self._projetos = value
+        valor, erro = _verificar_projetos(value)
+        if erro:
+            raise ValueError(erro.mensagem)
+        self._projetos = valor
 
     @property
     def _bonus_ferias(self) -> Decimal:
@@ -248,6 +526,17 @@ class Freelancer(Funcionario):
             total += self.BONUS_HORAS
         return total
 
+    @classmethod
+    def salario_total_lote(cls, colunas: Mapping[str, Sequence[Any]]) -> List[Decimal]:
+        if not cls._regras_de(Freelancer):
+            return super().salario_total_lote(colunas)
+        pagamento, bonus_horas, limite = cls.PAGAMENTO_POR_PROJETO, cls.BONUS_HORAS, cls.LIMITE_HORAS_BONUS
+        bonus_ferias, zero = cls.BONUS_FERIAS, Decimal('0.00')
+        return [
+            _centavos(Decimal(p) * pagamento + (bonus_horas if h > limite else zero) + (bonus_ferias if f else zero))
+            for h, p, f in zip(colunas['horas'], colunas['projetos'], colunas['ferias'])
+        ]
+
     def to_dict(self) -> Dict[str, Any]:
         data = super().to_dict()
         data.update({
@@ -259,24 +548,218 @@ class Freelancer(Funcionario):
         return data
 
 
-class Relatorio(ABC):
-    """Interface para geração de relatórios de funcionários."""
+def _centavos(valor: Decimal) -> Decimal:
+    return valor.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+class EstadoDescontos:
+    """Estado compartilhado pelas etapas de desconto de um funcionário.
+
+    Attributes:
+        bruto (Decimal): Salário bruto (``salario_total``).
+        base_ir (Decimal): Base de cálculo do imposto, reduzida pelas etapas anteriores.
+        dependentes (int): Número de dependentes.
+        liquido (Decimal): Salário restante após os descontos já aplicados
+            (atualizado pelo ``DescontosFolha``).
+    """
+    __slots__ = ('bruto', 'base_ir', 'dependentes', 'liquido')
+
+    def __init__(self, bruto: Decimal, dependentes: int = 0):
+        self.bruto = bruto
+        self.base_ir = bruto
+        self.dependentes = dependentes
+        self.liquido = bruto
+
+
+class EtapaDesconto(ABC):
+    """Etapa do pipeline de descontos aplicada após o salário bruto.
+
+    ``aplicar`` retorna o valor descontado (já arredondado em centavos) ou
+    None quando a etapa só ajusta o estado, sem gerar linha de desconto.
+    """
+
+    nome: str = ""
 
     @abstractmethod
-    def gerar(self, funcionario: Funcionario) -> str:
+    def aplicar(self, estado: EstadoDescontos) -> Optional[Decimal]:
         pass
 
+    def aplicar_lote(self, estados: List[EstadoDescontos]) -> List[Optional[Decimal]]:
+        return [self.aplicar(estado) for estado in estados]
 
-class RelatorioTexto(Relatorio):
-    cabecalho: str = "RELATÓRIO SALARIAL"
-    separador: str = "-" * 40
+
+class ContribuicaoProgressiva(EtapaDesconto):
+    """Contribuição por faixas progressivas (estilo INSS), limitada a um teto.
+
+    O valor descontado também reduz a base do imposto das etapas seguintes.
+    """
+
+    def __init__(self, nome: str, tabela: TabelaFaixas, teto: Optional[Any] = None):
+        self.nome = nome
+        self.tabela = tabela
+        self.teto = Decimal(str(teto)) if teto is not None else None
+
+    def _base(self, estado: EstadoDescontos) -> Decimal:
+        return estado.bruto if self.teto is None else min(estado.bruto, self.teto)
+
+    def aplicar(self, estado: EstadoDescontos) -> Optional[Decimal]:
+        desconto = _centavos(self.tabela.aplicar(self._base(estado)))
+        estado.base_ir -= desconto
+        return desconto
+
+    def aplicar_lote(self, estados: List[EstadoDescontos]) -> List[Optional[Decimal]]:
+        descontos = [_centavos(d) for d in self.tabela.aplicar_lote(self._base(e) for e in estados)]
+        for estado, desconto in zip(estados, descontos):
+            estado.base_ir -= desconto
+        return descontos
+
+
+class DeducaoDependentes(EtapaDesconto):
+    """Deduz um valor fixo por dependente da base do imposto (não gera desconto)."""
+
+    def __init__(self, valor_por_dependente: Any, nome: str = "Dependentes"):
+        self.nome = nome
+        self.valor_por_dependente = Decimal(str(valor_por_dependente))
+
+    def aplicar(self, estado: EstadoDescontos) -> Optional[Decimal]:
+        estado.base_ir -= self.valor_por_dependente * estado.dependentes
+        return None
+
+
+class ImpostoProgressivo(EtapaDesconto):
+    """Imposto por faixas progressivas (estilo IRRF) sobre a base acumulada."""
+
+    def __init__(self, nome: str, tabela: TabelaFaixas):
+        self.nome = nome
+        self.tabela = tabela
+
+    def aplicar(self, estado: EstadoDescontos) -> Optional[Decimal]:
+        return _centavos(self.tabela.aplicar(max(estado.base_ir, Decimal('0'))))
+
+    def aplicar_lote(self, estados: List[EstadoDescontos]) -> List[Optional[Decimal]]:
+        zero = Decimal('0')
+        return [_centavos(d) for d in self.tabela.aplicar_lote(max(e.base_ir, zero) for e in estados)]
+
+
+class DescontoFixo(EtapaDesconto):
+    """Desconto de valor fixo (ex: plano de saúde, vale-transporte).
+
+    Limitado ao salário restante, para que o líquido nunca fique negativo.
+    """
+
+    def __init__(self, nome: str, valor: Any):
+        self.nome = nome
+        self.valor = _centavos(Decimal(str(valor)))
+
+    def aplicar(self, estado: EstadoDescontos) -> Optional[Decimal]:
+        return min(self.valor, max(estado.liquido, Decimal('0.00')))
+
+
+class ResultadoDescontos(NamedTuple):
+    """Salário bruto, descontos por etapa (na ordem do pipeline) e salário líquido."""
+    bruto: Decimal
+    descontos: List[Tuple[str, Decimal]]
+    liquido: Decimal
+
+
+class DescontosFolha:
+    """Pipeline de descontos aplicado sobre ``salario_total``.
+
+    Todas as etapas são executadas em uma única passada por funcionário,
+    compartilhando um ``EstadoDescontos``; ``calcular_lote`` executa cada
+    etapa sobre o lote inteiro antes da seguinte, usando as buscas em lote
+    das tabelas de faixas.
+
+    O número de dependentes vem do argumento ``dependentes`` ou, se omitido,
+    do atributo ``dependentes`` do funcionário (0 quando não existir). Os
+    nomes das etapas identificam os descontos nos relatórios e devem ser únicos.
+    """
+
+    def __init__(self, etapas: Iterable[EtapaDesconto]):
+        self.etapas: List[EtapaDesconto] = list(etapas)
+        repetidos = sorted(nome for nome, total in Counter(e.nome for e in self.etapas).items() if total > 1)
+        if repetidos:
+            raise ValueError(f"Nomes de etapa repetidos: {', '.join(repetidos)}")
+
+    @staticmethod
+    def _dependentes(funcionario: Funcionario, dependentes: Optional[int]) -> int:
+        return getattr(funcionario, 'dependentes', 0) if dependentes is None else dependentes
+
+    def calcular(self, funcionario: Funcionario, dependentes: Optional[int] = None) -> ResultadoDescontos:
+        estado = EstadoDescontos(funcionario.salario_total(), self._dependentes(funcionario, dependentes))
+        descontos: List[Tuple[str, Decimal]] = []
+        for etapa in self.etapas:
+            desconto = etapa.aplicar(estado)
+            if desconto is not None:
+                descontos.append((etapa.nome, desconto))
+                estado.liquido -= desconto
+        return ResultadoDescontos(estado.bruto, descontos, estado.liquido)
+
+    def calcular_lote(
+        self,
+        funcionarios: Iterable[Funcionario],
+        dependentes: Optional[Iterable[int]] = None
+    ) -> List[ResultadoDescontos]:
+        funcionarios = list(funcionarios)
+        lista_dependentes = (
+            [self._dependentes(f, None) for f in funcionarios] if dependentes is None else list(dependentes)
+        )
+        if len(lista_dependentes) != len(funcionarios):
+            raise ValueError(
+                f"'dependentes' tem {len(lista_dependentes)} itens para {len(funcionarios)} funcionários"
+            )
+        estados = [EstadoDescontos(f.salario_total(), d) for f, d in zip(funcionarios, lista_dependentes)]
+        nomes: List[str] = []
+        colunas: List[List[Optional[Decimal]]] = []
+        for etapa in self.etapas:
+            valores = etapa.aplicar_lote(estados)
+            if all(valor is None for valor in valores):
+                continue  # etapa que só ajusta o estado
+            nomes.append(etapa.nome)
+            colunas.append(valores)
+            for estado, valor in zip(estados, valores):
+                if valor is not None:
+                    estado.liquido -= valor
+        linhas = zip(*colunas) if colunas else repeat((), len(estados))
+        return [
+            ResultadoDescontos(
+                estado.bruto,
+                [(nome, valor) for nome, valor in zip(nomes, linha) if valor is not None],
+                estado.liquido
+            )
+            for estado, linha in zip(estados, linhas)
+        ]
+
+
+class Relatorio(ABC):
+    """Interface para geração de relatórios de funcionários.
+
+    Com ``descontos`` (um ``DescontosFolha``), o relatório inclui os
+    descontos por etapa e o salário líquido.
+    """
+
+    extensao: str = "txt"
     moeda: str = "R$"
+    descontos: Optional[DescontosFolha] = None
+
+    def __init__(self, descontos: Optional[DescontosFolha] = None):
+        if descontos is not None:
+            self.descontos = descontos
 
     def _formatar_moeda(self, valor: Decimal) -> str:
         texto = f"{self.moeda} {valor:,.2f}"
         # Trocar separadores para formato brasileiro
         return texto.replace(",", "X").replace(".", ",").replace("X", ".")
 
+    @abstractmethod
+    def gerar(self, funcionario: Funcionario) -> str:
+        pass
+
+
+class RelatorioTexto(Relatorio):
+    cabecalho: str = "RELATÓRIO SALARIAL"
+    separador: str = "-" * 40
+
     def gerar(self, funcionario: Funcionario) -> str:
         dados = funcionario.to_dict()
         linhas = [
@@ -294,36 +777,552 @@ class RelatorioTexto(Relatorio):
             linhas.append(f"Projetos concluídos: {dados['projetos']}")
 
         linhas.append(f"Salário total: {self._formatar_moeda(Decimal(str(dados['salario_total'])))}")
+
+        if self.descontos is not None:
+            resultado = self.descontos.calcular(funcionario)
+            for nome, valor in resultado.descontos:
+                linhas.append(f"{nome}: -{self._formatar_moeda(valor)}")
+            linhas.append(f"Salário líquido: {self._formatar_moeda(resultado.liquido)}")
+
         linhas.append(self.separador)
 
         return "\n".join(linhas)
 
 
 class RelatorioJSON(Relatorio):
+    extensao: str = "json"
     indent: int = 2
     ensure_ascii: bool = False
 
     def gerar(self, funcionario: Funcionario) -> str:
+        import json
         dados = funcionario.to_dict()
+        if self.descontos is not None:
+            resultado = self.descontos.calcular(funcionario)
+            dados['descontos'] = {nome: float(valor) for nome, valor in resultado.descontos}
+            dados['salario_liquido'] = float(resultado.liquido)
         return json.dumps(dados, indent=self.indent, ensure_ascii=self.ensure_ascii)
 
 
+class RelatorioConsolidado(Relatorio):
+    """Resumo da folha por tipo, calculado em uma única passada pelo roster.
+
+    Para cada tipo acumula quantidade de funcionários, total de salários,
+    gasto com bônus de férias, comissões e bônus de vendas (Vendedor) e horas
+    extras (Efetivo); com ``descontos``, também o total descontado e o
+    líquido. Só os acumuladores ficam em memória: ``funcionarios`` pode ser
+    um gerador, e cada funcionário é liberado assim que é contabilizado.
+    Itens None (ex: falhas de ``FabricaFuncionario.criar``) são ignorados.
+    """
+
+    cabecalho: str = "RELATÓRIO CONSOLIDADO DA FOLHA"
+    separador: str = "-" * 40
+    indent: int = 2
+    ensure_ascii: bool = False
+    _CAMPOS_MOEDA = ('salario_total', 'bonus_ferias', 'comissoes', 'bonus_vendas', 'descontos', 'salario_liquido')
+
+    def __init__(self, formato: str = "texto", descontos: Optional[DescontosFolha] = None):
+        super().__init__(descontos)
+        if formato not in ("texto", "json"):
+            raise ValueError(f"Formato de relatório desconhecido: '{formato}'")
+        self.formato = formato
+        self.extensao = "json" if formato == "json" else "txt"
+
+    def _novo_acumulador(self) -> Dict[str, Any]:
+        acumulador: Dict[str, Any] = {'funcionarios': 0, 'horas_extras': 0}
+        for campo in self._CAMPOS_MOEDA:
+            if campo in ('descontos', 'salario_liquido') and self.descontos is None:
+                continue
+            acumulador[campo] = Decimal('0.00')
+        return acumulador
+
+    def consolidar(self, funcionarios: Iterable[Optional[Funcionario]]) -> Dict[str, Dict[str, Any]]:
+        """Acumula os totais por tipo (nome da classe), mais a linha ``'TOTAL'``."""
+        por_tipo: Dict[str, Dict[str, Any]] = {}
+        for funcionario in funcionarios:
+            if funcionario is None:
+                continue
+            tipo = type(funcionario).__name__
+            acumulador = por_tipo.get(tipo)
+            if acumulador is None:
+                acumulador = por_tipo[tipo] = self._novo_acumulador()
+            salario = funcionario.salario_total()
+            acumulador['funcionarios'] += 1
+            acumulador['salario_total'] += salario
+            acumulador['bonus_ferias'] += funcionario.adicional_ferias()
+            if isinstance(funcionario, Vendedor):
+                acumulador['comissoes'] += funcionario.comissao()
+                acumulador['bonus_vendas'] += funcionario.bonus_vendas()
+            if isinstance(funcionario, Efetivo):
+                acumulador['horas_extras'] += funcionario.horas_extras()
+            if self.descontos is not None:
+                resultado = self.descontos.calcular(funcionario)
+                acumulador['descontos'] += salario - resultado.liquido
+                acumulador['salario_liquido'] += resultado.liquido
+
+        consolidado = {tipo: por_tipo[tipo] for tipo in sorted(por_tipo)}
+        total = self._novo_acumulador()
+        for acumulador in por_tipo.values():
+            for campo, valor in acumulador.items():
+                total[campo] += valor
+        consolidado['TOTAL'] = total
+        for acumulador in consolidado.values():
+            for campo in self._CAMPOS_MOEDA:
+                if campo in acumulador:
+                    acumulador[campo] = _centavos(acumulador[campo])
+        return consolidado
+
+    def gerar_consolidado(self, funcionarios: Iterable[Optional[Funcionario]]) -> str:
+        consolidado = self.consolidar(funcionarios)
+        if self.formato == "json":
+            import json
+            dados = {
+                tipo: {campo: float(valor) if isinstance(valor, Decimal) else valor
+                       for campo, valor in acumulador.items()}
+                for tipo, acumulador in consolidado.items()
+            }
+            return json.dumps(dados, indent=self.indent, ensure_ascii=self.ensure_ascii)
+
+        rotulos = {
+            'salario_total': "Salários",
+            'bonus_ferias': "Bônus de férias",
+            'comissoes': "Comissões",
+            'bonus_vendas': "Bônus de vendas",
+            'horas_extras': "Horas extras",
+            'descontos': "Descontos",
+            'salario_liquido': "Salário líquido",
+        }
+        linhas = [self.cabecalho]
+        for tipo, acumulador in consolidado.items():
+            linhas.append(self.separador)
+            linhas.append(f"{'Total geral' if tipo == 'TOTAL' else tipo}: {acumulador['funcionarios']} funcionário(s)")
+            for campo, rotulo in rotulos.items():
+                if campo not in acumulador:
+                    continue
+                valor = acumulador[campo]
+                texto = f"{valor}h" if campo == 'horas_extras' else self._formatar_moeda(valor)
+                linhas.append(f"  {rotulo}: {texto}")
+        linhas.append(self.separador)
+        return "\n".join(linhas)
+
+    def gerar(self, funcionario: Funcionario) -> str:
+        return self.gerar_consolidado([funcionario])
+
+
+def _nome_holerite(indice: int, nome: str, extensao: str) -> str:
+    """Nome de arquivo ordenável e seguro para o holerite de um funcionário."""
+    import unicodedata
+    ascii_nome = unicodedata.normalize('NFKD', nome).encode('ascii', 'ignore').decode('ascii')
+    slug = "".join(c if c.isalnum() else "_" for c in ascii_nome.lower()).strip("_")
+    return f"{indice:08d}_{slug}.{extensao}"
+
+
+def _renderizar_lote(relatorio: Relatorio, funcionarios: List[Funcionario]) -> List[Tuple[str, bytes]]:
+    return [(f.nome, relatorio.gerar(f).encode('utf-8')) for f in funcionarios]
+
+
+class _EscritorZip:
+    def __init__(self, destino: str):
+        import zipfile
+        if not os.path.exists(destino):
+            self._arquivo = zipfile.ZipFile(destino, 'w', compression=zipfile.ZIP_DEFLATED)
+            self._bruto = None
+        elif zipfile.is_zipfile(destino):
+            self._arquivo = zipfile.ZipFile(destino, 'a', compression=zipfile.ZIP_DEFLATED)
+            self._bruto = None
+        else:
+            self._recuperar(destino)
+
+    def _recuperar(self, destino: str) -> None:
+        """Reabre um zip interrompido antes de ``fechar`` (sem diretório central).
+
+        As entradas locais são percorridas desde o início até a primeira
+        incompleta: o ``ZipFile`` só grava o tamanho comprimido no cabeçalho
+        depois de gravar os dados, e com ``ZIP_DEFLATED`` esse tamanho nunca é
+        zero. O arquivo é truncado ao fim da última entrada completa, e as
+        entradas recuperadas entram no diretório central gravado ao fechar.
+        """
+        import struct
+        import zipfile
+        tamanho = os.path.getsize(destino)
+        bruto = open(destino, 'r+b')
+        recuperadas = []
+        fim = 0
+        while True:
+            bruto.seek(fim)
+            cabecalho = bruto.read(zipfile.sizeFileHeader)
+            if len(cabecalho) < zipfile.sizeFileHeader:
+                break
+            (assinatura, versao, _, flags, compressao, hora, data,
+             crc, comprimido, original, tam_nome, tam_extra) = struct.unpack(zipfile.structFileHeader, cabecalho)
+            inicio_dados = fim + zipfile.sizeFileHeader + tam_nome + tam_extra
+            if assinatura != zipfile.stringFileHeader or comprimido == 0 or inicio_dados + comprimido > tamanho:
+                break
+            nome = bruto.read(tam_nome).decode('utf-8' if flags & 0x800 else 'cp437')
+            info = zipfile.ZipInfo(nome, date_time=(
+                (data >> 9) + 1980, (data >> 5) & 0xF, data & 0x1F, hora >> 11, (hora >> 5) & 0x3F, (hora & 0x1F) * 2
+            ))
+            info.compress_type, info.flag_bits, info.extract_version = compressao, flags, versao
+            info.CRC, info.compress_size, info.file_size = crc, comprimido, original
+            info.extra = bruto.read(tam_extra)
+            info.external_attr = 0o600 << 16  # o mesmo de ZipFile.writestr
+            info.header_offset = fim
+            recuperadas.append(info)
+            fim = inicio_dados + comprimido
+        bruto.seek(fim)
+        bruto.truncate()
+        self._bruto = bruto
+        self._arquivo = zipfile.ZipFile(bruto, 'w', compression=zipfile.ZIP_DEFLATED)
+        for info in recuperadas:
+            self._arquivo.filelist.append(info)
+            self._arquivo.NameToInfo[info.filename] = info
+
+    def existentes(self) -> int:
+        return len(self._arquivo.namelist())
+
+    def escrever(self, indice: int, nome: str, dados: bytes) -> None:
+        self._arquivo.writestr(nome, dados)
+
+    def fechar(self) -> None:
+        self._arquivo.close()
+        if self._bruto is not None:
+            self._bruto.close()
+
+
+class _EscritorTar:
+    def __init__(self, destino: str):
+        import tarfile
+        self._tarfile = tarfile
+        if os.path.exists(destino):
+            self._recuperar(destino)
+            self._arquivo = tarfile.open(destino, 'a')
+        else:
+            self._arquivo = tarfile.open(destino, 'w')
+
+    def _recuperar(self, destino: str) -> None:
+        """Trunca o tar após o último membro completo e regrava o marcador de fim.
+
+        Um tar interrompido antes de ``fechar`` termina em um cabeçalho ou em
+        dados pela metade e sem os blocos nulos finais, o que o modo ``'a'`` do
+        ``tarfile`` recusa. Num tar fechado normalmente só os blocos finais são
+        regravados.
+        """
+        tarfile = self._tarfile
+        tamanho = os.path.getsize(destino)
+        fim = 0
+        try:
+            with tarfile.open(destino, 'r:') as arquivo:
+                for membro in arquivo:
+                    fim_membro = membro.offset_data + -(-membro.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+                    if fim_membro > tamanho:
+                        break
+                    fim = fim_membro
+        except tarfile.ReadError:
+            # Cabeçalho truncado ou arquivo vazio: vale o que foi lido até aqui
+            pass
+        with open(destino, 'r+b') as arquivo:
+            arquivo.seek(fim)
+            arquivo.truncate()
+            arquivo.write(tarfile.NUL * (2 * tarfile.BLOCKSIZE))
+
+    def existentes(self) -> int:
+        return len(self._arquivo.getnames())
+
+    def escrever(self, indice: int, nome: str, dados: bytes) -> None:
+        import io
+        info = self._tarfile.TarInfo(nome)
+        info.size = len(dados)
+        self._arquivo.addfile(info, io.BytesIO(dados))
+
+    def fechar(self) -> None:
+        self._arquivo.close()
+
+
+class _EscritorDiretorio:
+    def __init__(self, destino: str, por_diretorio: int):
+        self._destino = destino
+        self._por_diretorio = por_diretorio
+        os.makedirs(destino, exist_ok=True)
+
+    def existentes(self) -> int:
+        import re
+        # Só conta arquivos no padrão de _nome_holerite; temporários e arquivos alheios não contam
+        padrao = re.compile(r'\d{8}_\w*\.\w+')
+        total = 0
+        for raiz, _, arquivos in os.walk(self._destino):
+            total += sum(1 for nome in arquivos if padrao.fullmatch(nome))
+        return total
+
+    def escrever(self, indice: int, nome: str, dados: bytes) -> None:
+        pasta = os.path.join(self._destino, f"{indice // self._por_diretorio:05d}")
+        os.makedirs(pasta, exist_ok=True)
+        caminho = os.path.join(pasta, nome)
+        # Escrita atômica: um arquivo interrompido nunca é contado como pronto
+        with open(caminho + '.tmp', 'wb') as arquivo:
+            arquivo.write(dados)
+        os.replace(caminho + '.tmp', caminho)
+
+    def fechar(self) -> None:
+        pass
+
+
+def exportar_holerites(
+    funcionarios: Iterable[Optional[Funcionario]],
+    destino: str,
+    relatorio: Optional[Relatorio] = None,
+    formato: Optional[str] = None,
+    trabalhadores: int = 4,
+    usar_processos: bool = False,
+    tamanho_lote: int = 64,
+    max_lotes_em_voo: int = 16,
+    por_diretorio: int = 1000
+) -> int:
+    """Gera um holerite por funcionário em paralelo e grava tudo em um único destino.
+
+    ``formato`` é ``'zip'``, ``'tar'`` ou ``'diretorio'`` (inferido pela
+    extensão de ``destino`` quando omitido); no modo diretório os arquivos
+    são distribuídos em subpastas de ``por_diretorio`` arquivos.
+
+    A renderização roda em um pool de threads (ou de processos, com
+    ``usar_processos``), em lotes de ``tamanho_lote``. No máximo
+    ``max_lotes_em_voo`` lotes ficam pendentes, o que limita a memória
+    independentemente do tamanho de ``funcionarios`` (consumido sob demanda).
+    Itens None (ex: falhas de ``FabricaFuncionario.criar``) são ignorados,
+    como em ``RelatorioConsolidado``, e não ocupam índice.
+    Os holerites são gravados na ordem de entrada, com o índice no nome do
+    arquivo; se ``destino`` já existir, a exportação é retomada a partir do
+    primeiro índice ainda não gravado. Isso vale também para uma exportação
+    morta no meio (ex: SIGKILL): zip e tar são truncados após a última
+    entrada completa, e no modo diretório a escrita de cada arquivo é atômica.
+
+    Returns:
+        int: Número de holerites gravados nesta chamada.
+    """
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    from itertools import islice
+
+    relatorio = relatorio or RelatorioTexto()
+    if formato is None:
+        formato = {'.zip': 'zip', '.tar': 'tar'}.get(os.path.splitext(destino)[1].lower(), 'diretorio')
+    if formato == 'zip':
+        escritor: Any = _EscritorZip(destino)
+    elif formato == 'tar':
+        escritor = _EscritorTar(destino)
+    elif formato == 'diretorio':
+        escritor = _EscritorDiretorio(destino, por_diretorio)
+    else:
+        raise ValueError(f"Formato de exportação desconhecido: '{formato}'")
+
+    try:
+        ja_gravados = escritor.existentes()
+        # None é descartado antes do islice para a retomada pular os mesmos itens
+        validos = (f for f in funcionarios if f is not None)
+        restantes = islice(validos, ja_gravados, None)
+        indice = ja_gravados
+
+        def gravar(lote: List[Tuple[str, bytes]]) -> None:
+            nonlocal indice
+            for nome, dados in lote:
+                escritor.escrever(indice, _nome_holerite(indice, nome, relatorio.extensao), dados)
+                indice += 1
+
+        executor = ProcessPoolExecutor if usar_processos else ThreadPoolExecutor
+        with executor(max_workers=trabalhadores) as pool:
+            pendentes: Any = deque()
+            while True:
+                lote = list(islice(restantes, tamanho_lote))
+                if not lote:
+                    break
+                pendentes.append(pool.submit(_renderizar_lote, relatorio, lote))
+                if len(pendentes) >= max_lotes_em_voo:
+                    gravar(pendentes.popleft().result())
+            while pendentes:
+                gravar(pendentes.popleft().result())
+    finally:
+        escritor.fechar()
+
+    return indice - ja_gravados
+
+
+class _EntradaDespacho(NamedTuple):
+    """Entrada imutável da tabela de despacho da fábrica."""
+    classe: Type[Funcionario]
+    campos_obrigatorios: Tuple[str, ...]
+    campos_aceitos: Optional[FrozenSet[str]]  # None = aceita qualquer campo extra
+
+
+def _montar_entrada(
+    tipo_funcionario: Type[Funcionario],
+    campos_obrigatorios: Optional[Tuple[str, ...]] = None
+) -> _EntradaDespacho:
+    """Pré-calcula os campos extras exigidos e aceitos pelo construtor do tipo."""
+    import inspect
+    parametros = list(inspect.signature(tipo_funcionario.__init__).parameters.values())[1:]
+    basicos = {'nome', 'horas', 'ferias'}
+    extras = [
+        p for p in parametros
+        if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY) and p.name not in basicos
+    ]
+    aceita_qualquer = any(p.kind is p.VAR_KEYWORD for p in parametros)
+    aceitos = None if aceita_qualquer else frozenset(p.name for p in extras)
+    if campos_obrigatorios is None:
+        campos_obrigatorios = tuple(p.name for p in extras if p.default is p.empty)
+    return _EntradaDespacho(tipo_funcionario, tuple(campos_obrigatorios), aceitos)
+
+
+class ResultadoValidacao(NamedTuple):
+    """Resultado de ``FabricaFuncionario.validar_e_criar``."""
+    funcionario: Optional[Funcionario]
+    erros: List[ErroValidacao]
+
+
+class ResultadoLote:
+    """Resultado de ``FabricaFuncionario.criar_lote`` com estatísticas agregadas de erros.
+
+    Attributes:
+        funcionarios (list): Funcionários criados, na ordem das linhas válidas.
+        erros (list): Pares ``(índice da linha, ErroValidacao)``.
+        estatisticas (Counter): Contagem de erros por ``(campo, codigo)``.
+        linhas_invalidas (int): Número de linhas com pelo menos um erro.
+    """
+
+    def __init__(self):
+        self.funcionarios: List[Funcionario] = []
+        self.erros: List[Tuple[int, ErroValidacao]] = []
+        self.estatisticas: Counter = Counter()
+        self.linhas_invalidas = 0
+
+    def resumo(self) -> str:
+        """Resumo em uma linha, adequado para o log."""
+        total = len(self.funcionarios) + self.linhas_invalidas
+        detalhes = ", ".join(
+            f"{campo or '-'}/{codigo}: {qtd}" for (campo, codigo), qtd in self.estatisticas.most_common()
+        )
+        return f"{self.linhas_invalidas} de {total} linhas inválidas ({detalhes})"
+
+
 class FabricaFuncionario:
-    """Fábrica para criação de funcionários com registro dinâmico de tipos."""
+    """Fábrica para criação de funcionários com registro dinâmico de tipos.
 
-    _tipos_registrados: Dict[str, Type[Funcionario]] = {
-        'estagiario': Estagiario,
-        'efetivo': Efetivo,
-        'vendedor': Vendedor,
-        'freelancer': Freelancer
-    }
+    O registro é copy-on-write: ``registrar_tipo`` monta um novo mapeamento
+    imutável e o publica com uma única atribuição, de modo que ``criar`` lê
+    um snapshot consistente sem precisar de trava. Só os escritores
+    concorrentes são serializados.
+    """
+
+    # Tipos nativos declarados por extenso, para não importar inspect na carga
+    # do módulo; equivalem a _montar_entrada(classe)
+    _despacho: Mapping[str, _EntradaDespacho] = MappingProxyType({
+        'estagiario': _EntradaDespacho(Estagiario, (), frozenset()),
+        'efetivo': _EntradaDespacho(Efetivo, (), frozenset()),
+        'vendedor': _EntradaDespacho(Vendedor, ('vendas',), frozenset({'vendas'})),
+        'freelancer': _EntradaDespacho(Freelancer, ('projetos',), frozenset({'projetos'}))
+    })
+    _trava_escrita = threading.Lock()
 
     @classmethod
-    def registrar_tipo(cls, nome: str, tipo_funcionario: Type[Funcionario]):
-        """Registra um novo tipo de funcionário na fábrica."""
-        if not issubclass(tipo_funcionario, Funcionario):
+    def registrar_tipo(
+        cls,
+        nome: str,
+        tipo_funcionario: Type[Funcionario],
+        campos_obrigatorios: Optional[Tuple[str, ...]] = None
+    ):
+        """Registra um novo tipo de funcionário na fábrica.
+
+        Os campos extras obrigatórios são inferidos da assinatura do
+        construtor, a menos que ``campos_obrigatorios`` seja informado.
+        """
+        if not isinstance(tipo_funcionario, type) or not issubclass(tipo_funcionario, Funcionario):
             raise ValueError("Tipo deve ser uma subclasse de Funcionario")
-        cls._tipos_registrados[nome.lower()] = tipo_funcionario
+        entrada = _montar_entrada(tipo_funcionario, campos_obrigatorios)
+        with cls._trava_escrita:
+            novo = dict(cls._despacho)
+            novo[nome.lower()] = entrada
+            cls._despacho = MappingProxyType(novo)
+
+    @classmethod
+    def tipos_registrados(cls) -> Dict[str, Type[Funcionario]]:
+        """Retorna uma cópia do snapshot atual de tipos registrados."""
+        return {nome: entrada.classe for nome, entrada in cls._despacho.items()}
+
+    @classmethod
+    def validar_e_criar(
+        cls,
+        tipo: str,
+        nome: str,
+        horas: Any,
+        vendas: Optional[Any] = None,
+        projetos: Optional[Any] = None,
+        ferias: bool = False,
+        **outros: Any
+    ) -> ResultadoValidacao:
+        """Valida os dados sem lançar exceções e cria o funcionário se forem válidos.
+
+        Retorna todos os erros encontrados na linha como ``ErroValidacao``.
+        Exceções só ocorrem para falhas inesperadas (não ``ValueError``) do
+        construtor do tipo registrado.
+        """
+        entrada = cls._despacho.get(tipo.lower()) if isinstance(tipo, str) else None
+        if entrada is None:
+            return ResultadoValidacao(None, [
+                ErroValidacao('tipo', 'tipo_invalido', f"Tipo de funcionário não registrado: '{tipo}'")
+            ])
+
+        informados: Dict[str, Any] = {'vendas': vendas, 'projetos': projetos}
+        informados.update(outros)
+
+        erros: List[ErroValidacao] = []
+        for campo in entrada.campos_obrigatorios:
+            if informados.get(campo) is None:
+                erros.append(ErroValidacao(
+                    campo, 'obrigatorio',
+                    f"É obrigatório informar '{campo}' para {entrada.classe.__name__}"
+                ))
+
+        dados_extra: Dict[str, Any] = {'ferias': ferias}
+        for campo, valor in informados.items():
+            if valor is not None and (entrada.campos_aceitos is None or campo in entrada.campos_aceitos):
+                dados_extra[campo] = valor
+
+        for campo, valor in (('nome', nome), ('horas', horas), *dados_extra.items()):
+            verificador = _VERIFICADORES.get(campo)
+            if verificador is not None:
+                erro = verificador(valor)[1]
+                if erro:
+                    erros.append(erro)
+
+        if erros:
+            return ResultadoValidacao(None, erros)
+        try:
+            return ResultadoValidacao(entrada.classe.criar(nome=nome, horas=horas, **dados_extra), [])
+        except ValueError as ve:
+            # Campos de tipos personalizados sem verificador registrado
+            return ResultadoValidacao(None, [ErroValidacao('', 'invalido', str(ve))])
+
+    @classmethod
+    def criar_lote(cls, linhas: Iterable[Mapping[str, Any]]) -> ResultadoLote:
+        """Cria funcionários a partir de dicionários com as chaves aceitas por ``criar``.
+
+        Linhas inválidas não são registradas no log individualmente: os erros
+        ficam em ``ResultadoLote.erros`` e só um resumo agregado é registrado.
+        """
+        resultado = ResultadoLote()
+        for indice, linha in enumerate(linhas):
+            try:
+                funcionario, erros = cls.validar_e_criar(**linha)
+            except Exception as e:
+                funcionario, erros = None, [ErroValidacao('', 'inesperado', str(e))]
+            if funcionario is not None:
+                resultado.funcionarios.append(funcionario)
+            for erro in erros:
+                resultado.erros.append((indice, erro))
+                resultado.estatisticas[(erro.campo, erro.codigo)] += 1
+            if erros:
+                resultado.linhas_invalidas += 1
+        if resultado.linhas_invalidas:
+            _logger().warning(resultado.resumo())
+        return resultado
 
     @classmethod
     def criar(
@@ -333,33 +1332,863 @@ class FabricaFuncionario:
         horas: Any,
         vendas: Optional[Any] = None,
         projetos: Optional[Any] = None,
-        ferias: bool = False
+        ferias: bool = False,
+        **outros: Any
     ) -> Optional[Funcionario]:
         """Cria uma instância do tipo de funcionário especificado."""
         try:
-            tipo_lower = tipo.lower()
-            if tipo_lower not in cls._tipos_registrados:
-                raise ValueError(f"Tipo de funcionário não registrado: '{tipo}'")
+            funcionario, erros = cls.validar_e_criar(
+                tipo, nome, horas, vendas=vendas, projetos=projetos, ferias=ferias, **outros
+            )
+            if erros:
+                _logger().error(f"Erro de validação: {erros[0].mensagem}")
+            return funcionario
+        except Exception as e:
+            _logger().exception(f"Erro inesperado ao criar funcionário: {e}")
 
-            dados_extra: Dict[str, Any] = {'ferias': ferias}
+        return None
 
-            if tipo_lower == 'vendedor':
-                if vendas is None:
-                    raise ValueError("É obrigatório informar 'vendas' para Vendedor")
-                dados_extra['vendas'] = vendas
 
-            if tipo_lower == 'freelancer':
-                if projetos is None:
-                    raise ValueError("É obrigatório informar 'projetos' para Freelancer")
-                dados_extra['projetos'] = projetos
+class RosterColunar:
+    """Roster em formato colunar, já validado, pronto para o cálculo em lote.
 
-            return cls._tipos_registrados[tipo_lower].criar(
-                nome=nome, horas=horas, **dados_extra
-            )
+    Attributes:
+        tipos (list): Tipo registrado na fábrica (minúsculo) de cada linha.
+        nomes (list): Nomes normalizados.
+        horas (array): Horas trabalhadas (``array('q')``).
+        ferias (bytearray): 1 para férias, 0 caso contrário.
+        vendas (list): ``Decimal`` ou None quando o tipo não usa vendas.
+        projetos (list): ``int`` ou None quando o tipo não usa projetos.
+    """
+
+    _CAMPOS_EXTRAS = ('vendas', 'projetos')
+    MAX_HORAS = 2 ** 63 - 1  # limite de array('q')
+
+    def __init__(self):
+        from array import array
+        self.tipos: List[str] = []
+        self.nomes: List[str] = []
+        self.horas = array('q')
+        self.ferias = bytearray()
+        self.vendas: List[Optional[Decimal]] = []
+        self.projetos: List[Optional[int]] = []
+
+    def __len__(self) -> int:
+        return len(self.tipos)
+
+    def anexar(self, tipo: str, nome: str, horas: int, ferias: bool,
+               vendas: Optional[Decimal] = None, projetos: Optional[int] = None) -> None:
+        self.tipos.append(tipo)
+        self.nomes.append(nome)
+        self.horas.append(horas)
+        self.ferias.append(1 if ferias else 0)
+        self.vendas.append(vendas)
+        self.projetos.append(projetos)
+
+    def estender(self, outro: 'RosterColunar') -> None:
+        self.tipos.extend(outro.tipos)
+        self.nomes.extend(outro.nomes)
+        self.horas.extend(outro.horas)
+        self.ferias.extend(outro.ferias)
+        self.vendas.extend(outro.vendas)
+        self.projetos.extend(outro.projetos)
+
+    def _grupos(self) -> Dict[str, List[int]]:
+        grupos: Dict[str, List[int]] = {}
+        for indice, tipo in enumerate(self.tipos):
+            grupos.setdefault(tipo, []).append(indice)
+        return grupos
+
+    def _colunas(self, entrada: _EntradaDespacho, indices: List[int]) -> Dict[str, List[Any]]:
+        colunas: Dict[str, List[Any]] = {
+            'nome': [self.nomes[i] for i in indices],
+            'horas': [self.horas[i] for i in indices],
+            'ferias': [bool(self.ferias[i]) for i in indices],
+        }
+        for campo in self._CAMPOS_EXTRAS:
+            if entrada.campos_aceitos is None or campo in entrada.campos_aceitos:
+                coluna = getattr(self, campo)
+                colunas[campo] = [coluna[i] for i in indices]
+        return colunas
+
+    def salarios_totais(self) -> List[Decimal]:
+        """``salario_total`` de cada linha, calculado tipo a tipo com ``salario_total_lote``."""
+        despacho = FabricaFuncionario._despacho
+        resultado: List[Any] = [None] * len(self)
+        for tipo, indices in self._grupos().items():
+            entrada = despacho[tipo]
+            for indice, salario in zip(indices, entrada.classe.salario_total_lote(self._colunas(entrada, indices))):
+                resultado[indice] = salario
+        return resultado
+
+    def funcionarios(self) -> Iterable[Funcionario]:
+        """Materializa os funcionários sob demanda (ex: para os relatórios)."""
+        despacho = FabricaFuncionario._despacho
+        for i, tipo in enumerate(self.tipos):
+            entrada = despacho[tipo]
+            extras = {
+                campo: getattr(self, campo)[i] for campo in self._CAMPOS_EXTRAS
+                if getattr(self, campo)[i] is not None
+                and (entrada.campos_aceitos is None or campo in entrada.campos_aceitos)
+            }
+            yield entrada.classe.criar(nome=self.nomes[i], horas=self.horas[i], ferias=bool(self.ferias[i]), **extras)
+
+
+class ResultadoCargaCSV(NamedTuple):
+    """Resultado de ``carregar_csv_colunar``; ``erros`` traz pares (linha do arquivo, erro)."""
+    roster: RosterColunar
+    erros: List[Tuple[int, ErroValidacao]]
+    estatisticas: Counter
+
+
+_VERDADEIROS_CSV = frozenset({'1', 'true', 'verdadeiro', 'sim', 's', 'yes', 'y', 'x'})
+
+
+def _numero_csv(texto: str) -> Any:
+    """Converte um campo numérico do CSV em int ou float, como um chamador Python passaria.
+
+    Textos não numéricos são devolvidos como estão, para que os verificadores
+    dos setters gerem o mesmo erro que gerariam com esse valor.
+    """
+    try:
+        return int(texto)
+    except ValueError:
+        pass
+    try:
+        return float(texto)
+    except ValueError:
+        return texto
+
+
+def _limites_blocos(mapa: Any, inicio: int, tamanho_bloco: int) -> List[Tuple[int, int]]:
+    """Divide ``mapa[inicio:]`` em faixas de bytes terminadas em quebra de linha."""
+    blocos = []
+    fim_arquivo = len(mapa)
+    while inicio < fim_arquivo:
+        fim = mapa.find(b'\n', min(inicio + tamanho_bloco, fim_arquivo) - 1)
+        fim = fim_arquivo if fim == -1 else fim + 1
+        blocos.append((inicio, fim))
+        inicio = fim
+    return blocos
+
+
+def _parsear_bloco_csv(
+    caminho: str,
+    inicio: int,
+    fim: int,
+    cabecalho: List[str],
+    requisitos: Mapping[str, Tuple[str, Tuple[str, ...], Optional[FrozenSet[str]]]],
+    delimitador: str
+) -> Tuple[RosterColunar, List[Tuple[int, ErroValidacao]], int]:
+    """Valida as linhas de uma faixa de bytes e as acumula em um RosterColunar.
+
+    Retorna o roster do bloco, os erros com o índice da linha dentro do bloco
+    e o número de linhas lidas.
+    """
+    import csv
+    import mmap
+
+    with open(caminho, 'rb') as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        brutas = mapa[inicio:fim].split(b'\n')
+    # Só '\n' separa linhas, como em _limites_blocos: splitlines() também
+    # quebraria em '\x85', '\u2028' etc. dentro de um campo
+    if brutas[-1] == b'':
+        brutas.pop()
+    posicao = {campo: cabecalho.index(campo) for campo in cabecalho}
+    roster = RosterColunar()
+    erros: List[Tuple[int, ErroValidacao]] = []
+
+    # Cada linha é decodificada à parte: um byte inválido só invalida a sua
+    # linha, que segue vazia para o leitor e mantém a numeração
+    linhas: List[str] = []
+    for numero, bruta in enumerate(brutas):
+        try:
+            linhas.append(bruta.decode('utf-8'))
+        except UnicodeDecodeError as e:
+            linhas.append('')
+            erros.append((numero, ErroValidacao('linha', 'csv_invalido', f"Linha não está em UTF-8: {e}")))
+
+    def campo_de(registro: List[str], campo: str) -> Optional[str]:
+        indice = posicao.get(campo)
+        if indice is None or indice >= len(registro):
+            return None
+        valor = registro[indice].strip()
+        return valor or None
+
+    leitor = csv.reader(linhas, delimiter=delimitador)
+    while True:
+        try:
+            registro = next(leitor)
+        except StopIteration:
+            break
+        except csv.Error as e:
+            erros.append((leitor.line_num - 1, ErroValidacao('linha', 'csv_invalido', str(e))))
+            continue
+        # line_num conta as linhas consumidas, mesmo quando um registro ocupa várias
+        numero = leitor.line_num - 1
+        if not registro:
+            continue
+        if len(registro) != len(cabecalho):
+            erros.append((numero, ErroValidacao(
+                'linha', 'csv_invalido', f"Linha com {len(registro)} campos; o cabeçalho tem {len(cabecalho)}"
+            )))
+            continue
+        tipo = (campo_de(registro, 'tipo') or '').lower()
+        if not tipo:
+            erros.append((numero, ErroValidacao('tipo', 'obrigatorio', "É obrigatório informar 'tipo'")))
+            continue
+        if tipo not in requisitos:
+            erros.append((numero, ErroValidacao(
+                'tipo', 'tipo_invalido', f"Tipo de funcionário não registrado: '{campo_de(registro, 'tipo')}'"
+            )))
+            continue
+
+        classe, obrigatorios, aceitos = requisitos[tipo]
+        valores: Dict[str, Any] = {}
+        erros_linha: List[ErroValidacao] = []
+        for campo, converter in (('nome', None), ('horas', _numero_csv),
+                                 ('vendas', None), ('projetos', _numero_csv)):
+            # Como em validar_e_criar, extras que o tipo não aceita são ignorados
+            if aceitos is not None and campo in RosterColunar._CAMPOS_EXTRAS and campo not in aceitos:
+                continue
+            bruto = campo_de(registro, campo)
+            if bruto is None:
+                if campo in ('nome', 'horas') or campo in obrigatorios:
+                    erros_linha.append(ErroValidacao(
+                        campo, 'obrigatorio', f"É obrigatório informar '{campo}' para {classe}"
+                    ))
+                continue
+            valor, erro = _VERIFICADORES[campo](converter(bruto) if converter else bruto)
+            if erro is None and campo == 'horas' and valor > RosterColunar.MAX_HORAS:
+                erro = ErroValidacao('horas', 'fora_do_intervalo',
+                                     f"Horas trabalhadas excedem o limite do roster colunar ({RosterColunar.MAX_HORAS})")
+            if erro:
+                erros_linha.append(erro)
+            else:
+                valores[campo] = valor
+        for campo in obrigatorios:
+            if campo not in ('vendas', 'projetos'):
+                erros_linha.append(ErroValidacao(campo, 'nao_suportado', f"Campo '{campo}' não suportado no CSV"))
+
+        if erros_linha:
+            erros.extend((numero, erro) for erro in erros_linha)
+            continue
+        ferias = (campo_de(registro, 'ferias') or '').lower() in _VERDADEIROS_CSV
+        roster.anexar(tipo, valores['nome'], valores['horas'], ferias,
+                      valores.get('vendas'), valores.get('projetos'))
+    erros.sort(key=lambda item: item[0])
+    return roster, erros, len(linhas)
+
+
+def carregar_csv_colunar(
+    caminho: str,
+    trabalhadores: Optional[int] = None,
+    tamanho_bloco: int = 64 * 1024 * 1024,
+    usar_processos: bool = True,
+    delimitador: str = ','
+) -> ResultadoCargaCSV:
+    """Carrega um CSV de funcionários direto em um ``RosterColunar``.
+
+    O arquivo é mapeado em memória e dividido em blocos de aproximadamente
+    ``tamanho_bloco`` bytes, sempre terminados em quebra de linha; cada bloco
+    é lido e validado por um trabalhador (processos, por padrão) e os blocos
+    são concatenados na ordem do arquivo.
+
+    A primeira linha é o cabeçalho, com as colunas ``tipo``, ``nome``,
+    ``horas`` e, conforme o tipo, ``vendas``, ``projetos`` e ``ferias``.
+    Os valores seguem a semântica dos setters: horas e projetos aceitam
+    floats inteiros ("160.0"), vendas é lida como texto decimal exato e
+    ``ferias`` é verdadeiro para "1", "true", "sim", "s" ou "x". As linhas
+    terminam em "\\n" (ou "\\r\\n") e campos entre aspas não podem conter
+    quebras de linha; linhas fora de UTF-8 ou rejeitadas pelo módulo ``csv``
+    geram o erro ``csv_invalido``.
+    """
+    import csv
+    import mmap
+
+    requisitos = {
+        nome: (entrada.classe.__name__, entrada.campos_obrigatorios, entrada.campos_aceitos)
+        for nome, entrada in FabricaFuncionario._despacho.items()
+    }
+    with open(caminho, 'rb') as arquivo:
+        if os.fstat(arquivo.fileno()).st_size == 0:
+            return ResultadoCargaCSV(RosterColunar(), [], Counter())
+        with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            fim_cabecalho = mapa.find(b'\n')
+            fim_cabecalho = len(mapa) if fim_cabecalho == -1 else fim_cabecalho + 1
+            linha_cabecalho = mapa[:fim_cabecalho].decode('utf-8-sig').strip()
+            blocos = _limites_blocos(mapa, fim_cabecalho, tamanho_bloco)
+    cabecalho = [campo.strip().lower() for campo in next(csv.reader([linha_cabecalho], delimiter=delimitador), [])]
+
+    argumentos = [(caminho, inicio, fim, cabecalho, requisitos, delimitador) for inicio, fim in blocos]
+    if len(blocos) <= 1 or trabalhadores == 1:
+        resultados = [_parsear_bloco_csv(*args) for args in argumentos]
+    else:
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        executor = ProcessPoolExecutor if usar_processos else ThreadPoolExecutor
+        with executor(max_workers=trabalhadores) as pool:
+            resultados = list(pool.map(_parsear_bloco_csv, *zip(*argumentos)))
+
+    roster = RosterColunar()
+    erros: List[Tuple[int, ErroValidacao]] = []
+    estatisticas: Counter = Counter()
+    linha_arquivo = 2  # a linha 1 é o cabeçalho
+    for parte, erros_parte, lidas in resultados:
+        roster.estender(parte)
+        for numero, erro in erros_parte:
+            erros.append((linha_arquivo + numero, erro))
+            estatisticas[(erro.campo, erro.codigo)] += 1
+        linha_arquivo += lidas
+    return ResultadoCargaCSV(roster, erros, estatisticas)
+
+
+class EsbocoQuantis:
+    """Esboço de quantis com erro relativo limitado e memória limitada (estilo DDSketch).
+
+    Cada valor positivo cai no balde ``ceil(log(x) / log(gama))``, com
+    ``gama = (1 + alpha) / (1 - alpha)``; o quantil estimado fica a no máximo
+    ``alpha`` (erro relativo) do valor exato. Dois esboços com o mesmo
+    ``alpha`` são mesclados somando as contagens dos baldes, então o
+    resultado não depende de como o fluxo foi dividido entre shards.
+
+    Quando o número de baldes passa de ``max_baldes``, os baldes mais baixos
+    são fundidos: só os quantis mais baixos perdem precisão.
+    """
+
+    def __init__(self, alpha: float = 0.01, max_baldes: int = 2048):
+        if not 0 < alpha < 1:
+            raise ValueError("alpha deve estar entre 0 e 1")
+        self.alpha = alpha
+        self.max_baldes = max_baldes
+        self._gama = (1 + alpha) / (1 - alpha)
+        self._log_gama = math.log(self._gama)
+        self._baldes: Dict[int, int] = {}
+        self._zeros = 0
+        self.contagem = 0
+
+    def adicionar(self, valor: float) -> None:
+        if not valor >= 0 or math.isinf(valor):
+            raise ValueError("EsbocoQuantis aceita apenas valores finitos e não negativos")
+        self.contagem += 1
+        if valor == 0:
+            self._zeros += 1
+            return
+        indice = math.ceil(math.log(valor) / self._log_gama)
+        self._baldes[indice] = self._baldes.get(indice, 0) + 1
+        if len(self._baldes) > self.max_baldes:
+            self._fundir_baldes_baixos()
+
+    def _fundir_baldes_baixos(self) -> None:
+        indices = sorted(self._baldes)
+        excesso = len(indices) - self.max_baldes
+        destino = indices[excesso]
+        for indice in indices[:excesso]:
+            self._baldes[destino] += self._baldes.pop(indice)
+
+    def mesclar(self, outro: 'EsbocoQuantis') -> None:
+        if outro.alpha != self.alpha:
+            raise ValueError("Só é possível mesclar esboços com o mesmo alpha")
+        for indice, qtd in outro._baldes.items():
+            self._baldes[indice] = self._baldes.get(indice, 0) + qtd
+        self._zeros += outro._zeros
+        self.contagem += outro.contagem
+        if len(self._baldes) > self.max_baldes:
+            self._fundir_baldes_baixos()
+
+    def quantil(self, q: float) -> Optional[float]:
+        """Retorna o quantil ``q`` (entre 0 e 1), ou None se o esboço estiver vazio."""
+        if not 0 <= q <= 1:
+            raise ValueError("q deve estar entre 0 e 1")
+        if self.contagem == 0:
+            return None
+        posicao = q * (self.contagem - 1)
+        acumulado = self._zeros
+        if posicao < acumulado:
+            return 0.0
+        for indice in sorted(self._baldes):
+            acumulado += self._baldes[indice]
+            if posicao < acumulado:
+                return 2 * self._gama ** indice / (self._gama + 1)
+        return 2 * self._gama ** max(self._baldes) / (self._gama + 1)
+
+
+class _EstatisticasTipo:
+    """Acumulador de uma única passada para os salários de um tipo."""
+
+    def __init__(self, alpha: float):
+        self.contagem = 0
+        self.total = Decimal('0.00')
+        self.minimo: Optional[Decimal] = None
+        self.maximo: Optional[Decimal] = None
+        self._media = 0.0
+        self._m2 = 0.0  # soma dos quadrados dos desvios (Welford)
+        self.esboco = EsbocoQuantis(alpha)
+
+    def adicionar(self, salario: Decimal) -> None:
+        # O esboço valida o valor antes de qualquer outro campo mudar
+        valor = float(salario)
+        self.esboco.adicionar(valor)
+        self.contagem += 1
+        self.total += salario
+        if self.minimo is None or salario < self.minimo:
+            self.minimo = salario
+        if self.maximo is None or salario > self.maximo:
+            self.maximo = salario
+        delta = valor - self._media
+        self._media += delta / self.contagem
+        self._m2 += delta * (valor - self._media)
+
+    def mesclar(self, outro: '_EstatisticasTipo') -> None:
+        if outro.contagem == 0:
+            return
+        n = self.contagem + outro.contagem
+        delta = outro._media - self._media
+        self._m2 += outro._m2 + delta * delta * self.contagem * outro.contagem / n
+        self._media += delta * outro.contagem / n
+        self.contagem = n
+        self.total += outro.total
+        if self.minimo is None or outro.minimo < self.minimo:
+            self.minimo = outro.minimo
+        if self.maximo is None or outro.maximo > self.maximo:
+            self.maximo = outro.maximo
+        self.esboco.mesclar(outro.esboco)
+
+    def resumo(self) -> Dict[str, Any]:
+        media = (self.total / self.contagem).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return {
+            'contagem': self.contagem,
+            'total': self.total,
+            'media': media,
+            'minimo': self.minimo,
+            'maximo': self.maximo,
+            'desvio_padrao': math.sqrt(self._m2 / self.contagem),
+            'p50': self.esboco.quantil(0.50),
+            'p90': self.esboco.quantil(0.90),
+            'p99': self.esboco.quantil(0.99),
+        }
 
-        except ValueError as ve:
-            logger.error(f"Erro de validação: {ve}")
-        except Exception as e:
-            logger.exception(f"Erro inesperado ao criar funcionário: {e}")
 
+class EstatisticasSalariais:
+    """Estatísticas de ``salario_total`` por tipo, calculadas em uma única passada.
+
+    Média, total, mínimo e máximo são exatos; o desvio padrão (populacional)
+    usa o algoritmo de Welford e os quantis p50/p90/p99 usam ``EsbocoQuantis``
+    com erro relativo ``alpha``. Acumuladores de shards ou processos
+    diferentes (são serializáveis com ``pickle``) são combinados com ``mesclar``.
+    """
+
+    def __init__(self, alpha: float = 0.01):
+        self.alpha = alpha
+        self._por_tipo: Dict[str, _EstatisticasTipo] = {}
+
+    def adicionar(self, funcionario: Funcionario) -> None:
+        tipo = funcionario.__class__.__name__
+        acumulador = self._por_tipo.get(tipo)
+        if acumulador is None:
+            acumulador = self._por_tipo[tipo] = _EstatisticasTipo(self.alpha)
+        acumulador.adicionar(funcionario.salario_total())
+
+    def adicionar_todos(self, funcionarios: Iterable[Funcionario]) -> 'EstatisticasSalariais':
+        for funcionario in funcionarios:
+            self.adicionar(funcionario)
+        return self
+
+    def mesclar(self, outro: 'EstatisticasSalariais') -> 'EstatisticasSalariais':
+        if outro.alpha != self.alpha:
+            raise ValueError("Só é possível mesclar estatísticas com o mesmo alpha")
+        for tipo, acumulador in outro._por_tipo.items():
+            if tipo not in self._por_tipo:
+                self._por_tipo[tipo] = _EstatisticasTipo(self.alpha)
+            self._por_tipo[tipo].mesclar(acumulador)
+        return self
+
+    def resumo(self) -> Dict[str, Dict[str, Any]]:
+        """Estatísticas por tipo (nome da classe), em ordem alfabética."""
+        return {tipo: self._por_tipo[tipo].resumo() for tipo in sorted(self._por_tipo)}
+
+
+class FolhaIncremental:
+    """Folha de pagamento mantida incrementalmente a partir de eventos.
+
+    Os funcionários são identificados pelo nome normalizado (Title Case).
+    Cada evento altera um funcionário pelos setters validados e só o salário
+    dele é recalculado; os totais são ajustados pela diferença.
+
+    Eventos aceitos (campo ``evento``):
+        ``horas``: soma ``horas`` às horas trabalhadas.
+        ``vendas``: soma ``vendas`` às vendas (apenas tipos com vendas).
+        ``projeto``: soma ``projetos`` (padrão 1) aos projetos concluídos.
+        ``ferias``: define ``ferias`` (ou alterna, se o campo for omitido).
+        ``admissao``: cria um funcionário com os campos de ``FabricaFuncionario.criar``;
+            um nome já presente na folha é rejeitado (use ``adicionar`` para substituir).
+    """
+
+    def __init__(self, funcionarios: Iterable[Funcionario] = ()):
+        self.funcionarios: Dict[str, Funcionario] = {}
+        self._salarios: Dict[str, Decimal] = {}
+        self.total = Decimal('0.00')
+        self.totais_por_tipo: Dict[str, Decimal] = {}
+        self.contagem_por_tipo: Counter = Counter()
+        self.eventos_aplicados = 0
+        self.erros: Counter = Counter()
+        for funcionario in funcionarios:
+            self.adicionar(funcionario)
+
+    def adicionar(self, funcionario: Funcionario) -> None:
+        """Inclui (ou substitui, se o nome já existir) um funcionário na folha."""
+        anterior = self.funcionarios.get(funcionario.nome)
+        if anterior is not None:
+            self._ajustar(anterior, -self._salarios[anterior.nome])
+            self.contagem_por_tipo[type(anterior).__name__] -= 1
+        self.funcionarios[funcionario.nome] = funcionario
+        self._salarios[funcionario.nome] = Decimal('0.00')
+        self.contagem_por_tipo[type(funcionario).__name__] += 1
+        self._recalcular(funcionario)
+
+    def _ajustar(self, funcionario: Funcionario, delta: Decimal) -> None:
+        tipo = type(funcionario).__name__
+        self.total += delta
+        self.totais_por_tipo[tipo] = self.totais_por_tipo.get(tipo, Decimal('0.00')) + delta
+
+    def _recalcular(self, funcionario: Funcionario) -> None:
+        novo = funcionario.salario_total()
+        self._ajustar(funcionario, novo - self._salarios[funcionario.nome])
+        self._salarios[funcionario.nome] = novo
+
+    def aplicar_evento(self, evento: Mapping[str, Any]) -> Optional[ErroValidacao]:
+        """Aplica um evento; retorna None em caso de sucesso ou o erro encontrado.
+
+        A aplicação é atômica: se o evento falhar em qualquer etapa, inclusive
+        no recálculo do salário, o funcionário e os totais ficam como estavam.
+        """
+        try:
+            erro = self._aplicar(evento)
+        except Exception as e:
+            erro = ErroValidacao('evento', 'inesperado', str(e))
+        if erro is None:
+            self.eventos_aplicados += 1
+        else:
+            self.erros[(erro.campo, erro.codigo)] += 1
+        return erro
+
+    def _alterar(self, funcionario: Funcionario, campo: str, valor: Any) -> None:
+        """Atribui ``valor`` e recalcula; em caso de falha, restaura o valor anterior."""
+        anterior = getattr(funcionario, campo)
+        try:
+            setattr(funcionario, campo, valor)
+            novo = funcionario.salario_total()
+        except Exception:
+            setattr(funcionario, campo, anterior)
+            raise
+        self._ajustar(funcionario, novo - self._salarios[funcionario.nome])
+        self._salarios[funcionario.nome] = novo
+
+    def _aplicar(self, evento: Mapping[str, Any]) -> Optional[ErroValidacao]:
+        if not isinstance(evento, Mapping):
+            return ErroValidacao('evento', 'evento_invalido', "Evento deve ser um objeto JSON")
+        tipo_evento = evento.get('evento')
+
+        if tipo_evento == 'admissao':
+            dados = {chave: valor for chave, valor in evento.items() if chave != 'evento'}
+            try:
+                funcionario, erros = FabricaFuncionario.validar_e_criar(**dados)
+            except TypeError as e:
+                return ErroValidacao('evento', 'evento_invalido', str(e))
+            if erros:
+                return erros[0]
+            if funcionario.nome in self.funcionarios:
+                return ErroValidacao('nome', 'duplicado', f"Funcionário já está na folha: '{funcionario.nome}'")
+            # Calcula antes de incluir: um salário incalculável não entra na folha
+            funcionario.salario_total()
+            self.adicionar(funcionario)
+            return None
+
+        nome, erro = _verificar_nome(evento.get('nome'))
+        if erro:
+            return erro
+        funcionario = self.funcionarios.get(nome)
+        if funcionario is None:
+            return ErroValidacao('nome', 'funcionario_desconhecido', f"Funcionário não encontrado: '{nome}'")
+
+        if tipo_evento == 'ferias':
+            # Sem o campo 'ferias', o evento alterna o status atual
+            self._alterar(funcionario, 'ferias', evento.get('ferias', not funcionario.ferias))
+            return None
+        if tipo_evento == 'horas':
+            campo, padrao = 'horas', None
+        elif tipo_evento == 'vendas':
+            campo, padrao = 'vendas', None
+        elif tipo_evento == 'projeto':
+            campo, padrao = 'projetos', 1
+        else:
+            return ErroValidacao('evento', 'evento_invalido', f"Evento desconhecido: '{tipo_evento}'")
+        if not hasattr(funcionario, campo):
+            return ErroValidacao(campo, 'nao_suportado', f"{type(funcionario).__name__} não registra {campo}")
+
+        verificar = _VERIFICADORES[campo]
+        delta, erro = verificar(evento.get(campo, padrao))
+        if erro:
+            return erro
+        # O valor resultante é verificado antes de tocar no funcionário
+        novo, erro = verificar(getattr(funcionario, campo) + delta)
+        if erro:
+            return erro
+        self._alterar(funcionario, campo, novo)
         return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Visão consolidada atual da folha."""
+        return {
+            'funcionarios': len(self.funcionarios),
+            'total': self.total,
+            'por_tipo': {
+                tipo: {'funcionarios': self.contagem_por_tipo[tipo], 'total': self.totais_por_tipo[tipo]}
+                for tipo in sorted(self.totais_por_tipo) if self.contagem_por_tipo[tipo]
+            },
+            'eventos_aplicados': self.eventos_aplicados,
+            'erros': sum(self.erros.values()),
+        }
+
+
+def acompanhar_eventos(
+    caminho: str,
+    folha: FolhaIncremental,
+    ao_emitir: Callable[[Dict[str, Any]], None],
+    intervalo_snapshot: float = 60.0,
+    intervalo_leitura: float = 0.5,
+    seguir: bool = True,
+    parar: Optional[threading.Event] = None
+) -> int:
+    """Acompanha um arquivo JSONL de eventos (como ``tail -f``) aplicando-os à folha.
+
+    A cada ``intervalo_snapshot`` segundos, e ao terminar, chama ``ao_emitir``
+    com ``folha.snapshot()`` acrescido de ``eventos_por_segundo`` no intervalo.
+    Linhas ainda incompletas (sem quebra de linha) aguardam o restante; se o
+    arquivo for truncado, a leitura recomeça do início. Com ``seguir=False``
+    a função retorna ao chegar ao fim do arquivo; caso contrário, até ``parar``
+    ser sinalizado.
+
+    Returns:
+        int: Número de linhas de evento lidas.
+    """
+    import json
+    import time
+
+    lidas = 0
+    ultimo_momento = time.monotonic()
+    ultimo_lidas = 0
+
+    def emitir() -> None:
+        nonlocal ultimo_momento, ultimo_lidas
+        agora = time.monotonic()
+        dados = folha.snapshot()
+        dados['eventos_por_segundo'] = (lidas - ultimo_lidas) / max(agora - ultimo_momento, 1e-9)
+        ultimo_momento, ultimo_lidas = agora, lidas
+        ao_emitir(dados)
+
+    def processar(linha: bytes) -> None:
+        nonlocal lidas
+        if not linha.strip():
+            return
+        lidas += 1
+        try:
+            evento = json.loads(linha.decode('utf-8'))
+        except ValueError:
+            # Inclui UnicodeDecodeError: só linhas completas chegam aqui
+            folha.erros[('evento', 'json_invalido')] += 1
+            return
+        folha.aplicar_evento(evento)
+
+    # Leitura em bytes: o escritor pode gravar metade de um caractere
+    # multibyte, e só linhas completas são decodificadas
+    with open(caminho, 'rb') as arquivo:
+        pendente = b''
+        while True:
+            linha = arquivo.readline()
+            if linha:
+                pendente += linha
+                if pendente.endswith(b'\n'):
+                    processar(pendente)
+                    pendente = b''
+            else:
+                if not seguir:
+                    processar(pendente)
+                    break
+                if parar is not None and parar.is_set():
+                    break
+                if os.stat(caminho).st_size < arquivo.tell():
+                    arquivo.seek(0)
+                    pendente = b''
+                time.sleep(intervalo_leitura)
+            if time.monotonic() - ultimo_momento >= intervalo_snapshot:
+                emitir()
+    emitir()
+    return lidas
+
+
+def gerar_roster_sintetico(tamanho: int, semente: int = 0) -> List[Dict[str, Any]]:
+    """Gera linhas sintéticas válidas para ``FabricaFuncionario.criar_lote``.
+
+    Os quatro tipos nativos aparecem em proporções iguais, com horas, vendas,
+    projetos e férias aleatórios (reprodutíveis pela ``semente``).
+    """
+    import random
+    rng = random.Random(semente)
+    tipos = ('estagiario', 'efetivo', 'vendedor', 'freelancer')
+    linhas: List[Dict[str, Any]] = []
+    for i in range(tamanho):
+        tipo = tipos[i % len(tipos)]
+        linha: Dict[str, Any] = {
+            'tipo': tipo,
+            'nome': f"funcionario {i}",
+            'horas': rng.randint(0, 240),
+            'ferias': rng.random() < 0.1,
+        }
+        if tipo == 'vendedor':
+            linha['vendas'] = f"{rng.uniform(0, 30000):.2f}"
+        elif tipo == 'freelancer':
+            linha['projetos'] = rng.randint(0, 10)
+        linhas.append(linha)
+    return linhas
+
+
+def gerar_roster_casos_limite() -> List[Dict[str, Any]]:
+    """Gera linhas válidas nas fronteiras das regras dos quatro tipos nativos.
+
+    Cobre o limite de horas extras do efetivo, o limite de horas do
+    freelancer, o limite do bônus de vendas, vendas cuja comissão cai
+    exatamente em meio centavo (onde ``float`` e ``ROUND_HALF_UP`` divergem) e
+    valores grandes, sempre com e sem férias.
+    """
+    linhas: List[Dict[str, Any]] = []
+    for ferias in (False, True):
+        for horas in (0, 1, 179, 180, 181, 240, 10000):
+            linhas.append({'tipo': 'estagiario', 'nome': 'Caso Limite', 'horas': horas, 'ferias': ferias})
+            linhas.append({'tipo': 'efetivo', 'nome': 'Caso Limite', 'horas': horas, 'ferias': ferias})
+        for horas in (0, 99, 100, 101):
+            for projetos in (0, 1, 1000):
+                linhas.append({'tipo': 'freelancer', 'nome': 'Caso Limite', 'horas': horas,
+                               'projetos': projetos, 'ferias': ferias})
+        for vendas in ('0', '0.01', '0.10', '0.30', '10.10', '1234.50', '9999.99', '10000', '10000.01',
+                       '10000.10', '123456.70', '9999999.90', '1E+9'):
+            linhas.append({'tipo': 'vendedor', 'nome': 'Caso Limite', 'horas': 180,
+                           'vendas': vendas, 'ferias': ferias})
+    return linhas
+
+
+class PerfilMemoria:
+    """Resultado de ``perfilar_memoria``.
+
+    Attributes:
+        tamanho (int): Número de funcionários do roster sintético.
+        bytes_por_tipo (dict): Bytes retidos por funcionário, por classe.
+        etapas (list): Tuplas ``(etapa, bytes retidos, pico em bytes)``.
+        principais_alocacoes (list): ``tracemalloc.Statistic`` ordenadas por tamanho.
+    """
+
+    def __init__(self, tamanho: int):
+        self.tamanho = tamanho
+        self.bytes_por_tipo: Dict[str, float] = {}
+        self.etapas: List[Tuple[str, int, int]] = []
+        self.principais_alocacoes: List[Any] = []
+
+    def formatar(self) -> str:
+        linhas = [f"PERFIL DE MEMÓRIA ({self.tamanho} funcionários)", "Bytes por funcionário:"]
+        for tipo, valor in self.bytes_por_tipo.items():
+            linhas.append(f"  {tipo:<12} {valor:>10,.0f}")
+        linhas.append(f"{'Etapa':<16} {'retido (KiB)':>14} {'pico (KiB)':>12}")
+        for etapa, retido, pico in self.etapas:
+            linhas.append(f"{etapa:<16} {retido / 1024:>14,.1f} {pico / 1024:>12,.1f}")
+        linhas.append("Principais locais de alocação:")
+        for estatistica in self.principais_alocacoes:
+            quadro = estatistica.traceback[0]
+            linhas.append(f"  {estatistica.size / 1024:>10,.1f} KiB  {quadro.filename}:{quadro.lineno}")
+        return "\n".join(linhas)
+
+
+def perfilar_memoria(tamanho: int, top: int = 10, semente: int = 0) -> PerfilMemoria:
+    """Mede o uso de memória de cada etapa do processamento com ``tracemalloc``.
+
+    As etapas são: criação pela fábrica, cálculo de ``salario_total``,
+    ``to_dict`` e renderização com ``RelatorioTexto`` e ``RelatorioJSON``.
+    Os resultados de cada etapa ficam vivos até o fim, de modo que o valor
+    retido é o custo real de manter aquela etapa materializada.
+    """
+    import tracemalloc
+
+    linhas = gerar_roster_sintetico(tamanho, semente)
+    perfil = PerfilMemoria(tamanho)
+    ja_ativo = tracemalloc.is_tracing()
+    if not ja_ativo:
+        tracemalloc.start()
+    try:
+        # Bytes por funcionário de cada tipo, medidos isoladamente
+        por_tipo: Dict[str, List[Dict[str, Any]]] = {}
+        for linha in linhas:
+            por_tipo.setdefault(linha['tipo'], []).append(linha)
+        for grupo in por_tipo.values():
+            antes = tracemalloc.get_traced_memory()[0]
+            criados = FabricaFuncionario.criar_lote(grupo).funcionarios
+            depois = tracemalloc.get_traced_memory()[0]
+            if criados:
+                perfil.bytes_por_tipo[type(criados[0]).__name__] = (depois - antes) / len(criados)
+            del criados
+
+        etapas: List[Tuple[str, Callable[[List[Funcionario]], Any]]] = [
+            ('calculo', lambda fs: [f.salario_total() for f in fs]),
+            ('to_dict', lambda fs: [f.to_dict() for f in fs]),
+            ('relatorio_texto', lambda fs: [RelatorioTexto().gerar(f) for f in fs]),
+            ('relatorio_json', lambda fs: [RelatorioJSON().gerar(f) for f in fs]),
+        ]
+        resultados: List[Any] = []
+
+        def medir(nome: str, etapa: Callable[[], Any]) -> Any:
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+            antes = tracemalloc.get_traced_memory()[0]
+            resultado = etapa()
+            atual, pico = tracemalloc.get_traced_memory()
+            perfil.etapas.append((nome, atual - antes, pico - antes))
+            resultados.append(resultado)
+            return resultado
+
+        funcionarios = medir('fabrica', lambda: FabricaFuncionario.criar_lote(linhas).funcionarios)
+        for nome, etapa in etapas:
+            medir(nome, lambda etapa=etapa: etapa(funcionarios))
+
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ])
+        perfil.principais_alocacoes = snapshot.statistics('lineno')[:top]
+    finally:
+        if not ja_ativo:
+            tracemalloc.stop()
+    return perfil
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Folha de pagamento incremental a partir de eventos JSONL.")
+    parser.add_argument('eventos', help="arquivo JSONL de eventos (somente acréscimos)")
+    parser.add_argument('--roster', help="arquivo JSONL com os funcionários iniciais (campos de criar)")
+    parser.add_argument('--intervalo', type=float, default=60.0, help="segundos entre snapshots")
+    parser.add_argument('--ate-o-fim', action='store_true', help="processa até o fim do arquivo e sai")
+    args = parser.parse_args()
+
+    configurar_logging()
+    folha = FolhaIncremental()
+    if args.roster:
+        with open(args.roster, encoding='utf-8') as arquivo_roster:
+            linhas_roster = (json.loads(linha) for linha in arquivo_roster if linha.strip())
+            for funcionario in FabricaFuncionario.criar_lote(linhas_roster).funcionarios:
+                folha.adicionar(funcionario)
+    try:
+        acompanhar_eventos(
+            args.eventos, folha,
+            lambda dados: print(json.dumps(dados, default=str, ensure_ascii=False), flush=True),
+            intervalo_snapshot=args.intervalo, seguir=not args.ate_o_fim
+        )
+    except KeyboardInterrupt:
+        pass
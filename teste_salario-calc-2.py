@@ -1,7 +1,20 @@
 import pytest
 import json
+import math
+import pickle
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tarfile
+import threading
+import weakref
+import zipfile
 from decimal import Decimal
+from typing import Any
 
+import funcionarios
 from funcionarios import (
     Funcionario,
     Estagiario,
@@ -9,8 +22,26 @@ from funcionarios import (
     Vendedor,
     Freelancer,
     FabricaFuncionario,
+    ErroValidacao,
     RelatorioTexto,
-    RelatorioJSON
+    RelatorioJSON,
+    RelatorioConsolidado,
+    gerar_roster_sintetico,
+    perfilar_memoria,
+    EsbocoQuantis,
+    EstatisticasSalariais,
+    exportar_holerites,
+    TabelaFaixas,
+    DescontosFolha,
+    ContribuicaoProgressiva,
+    DeducaoDependentes,
+    ImpostoProgressivo,
+    DescontoFixo,
+    FolhaIncremental,
+    acompanhar_eventos,
+    carregar_csv_colunar,
+    gerar_roster_casos_limite,
+    RosterColunar
 )
 
 
@@ -189,6 +220,72 @@ def test_vendedor_to_dict():
     assert isinstance(dados['salario_total'], float)
 
 
+# ---------- Testes de Faixas Escalonadas ----------
+
+def test_tabela_faixas_progressiva():
+    tabela = TabelaFaixas([(0, '0.03'), (10000, '0.05'), (50000, '0.08')])
+    assert tabela.aplicar(Decimal('5000')) == Decimal('150.00')
+    # 10000 * 0.03 + 40000 * 0.05 + 10000 * 0.08
+    assert tabela.aplicar(Decimal('60000')) == Decimal('3100.00')
+    # Nos limites o resultado é contínuo
+    assert tabela.aplicar(Decimal('10000')) == Decimal('300.00')
+
+def test_tabela_faixas_degrau():
+    tabela = TabelaFaixas([(10000, 500), (30000, 1500)], progressiva=False)
+    assert tabela.aplicar(Decimal('10000')) == Decimal('0')
+    assert tabela.aplicar(Decimal('10000.01')) == Decimal('500')
+    assert tabela.aplicar(Decimal('99999')) == Decimal('1500')
+
+def test_tabela_faixas_lote_igual_escalar():
+    valores = [Decimal(v) for v in ('0', '9999.99', '10000', '10000.01', '25000', '123456.78')]
+    for progressiva in (True, False):
+        tabela = TabelaFaixas([(0, '0.02'), (10000, '0.04'), (20000, '0.06')], progressiva=progressiva)
+        assert tabela.aplicar_lote(valores) == [tabela.aplicar(v) for v in valores]
+
+def test_tabela_faixas_aceita_float_e_int():
+    tabela = TabelaFaixas([(0, '0.03'), (10000, '0.05'), (50000, '0.08')])
+    assert tabela.aplicar(60000.0) == tabela.aplicar(60000) == Decimal('3100.00')
+    assert tabela.aplicar(0.1) == Decimal('0.003')
+    assert tabela.aplicar_lote([5000.5, 10000, Decimal('60000')]) == [
+        Decimal('150.015'), Decimal('300.00'), Decimal('3100.00')
+    ]
+    degrau = TabelaFaixas([(10000, 500)], progressiva=False)
+    assert degrau.aplicar_lote([10000.0, 10000.01]) == [Decimal('0'), Decimal('500')]
+
+def test_tabela_faixas_invalida():
+    with pytest.raises(ValueError, match="não pode ser vazia"):
+        TabelaFaixas([])
+    with pytest.raises(ValueError, match="estritamente crescentes"):
+        TabelaFaixas([(0, '0.01'), (100, '0.02'), (100, '0.03')])
+    with pytest.raises(ValueError, match="não podem ser negativos"):
+        TabelaFaixas([(-1, '0.01')])
+
+def test_tabelas_equivalentes_reproduzem_regras_fixas():
+    """Tabelas montadas a partir das constantes fixas dão exatamente o mesmo salário."""
+    class VendedorTabelado(Vendedor):
+        FAIXAS_COMISSAO = TabelaFaixas([(0, TAXA_COMISSAO_VENDEDOR)])
+        FAIXAS_BONUS_VENDAS = TabelaFaixas([(LIMITE_BONUS_VENDEDOR, BONUS_VENDAS)], progressiva=False)
+
+    class EfetivoTabelado(Efetivo):
+        FAIXAS_HORAS = TabelaFaixas([(0, TARIFA_HORA_EFETIVO), (HORAS_LIMITE_EFETIVO, TARIFA_EXTRA_EFETIVO)])
+
+    for vendas in ('0', '9999.99', '10000', '10000.01', '54321.09'):
+        assert (VendedorTabelado.criar("Carlos Lima", 40, vendas=vendas).salario_total()
+                == Vendedor.criar("Carlos Lima", 40, vendas=vendas).salario_total())
+    for horas in (0, 179, 180, 181, 300):
+        assert EfetivoTabelado.criar("Maria Souza", horas).salario_total() == Efetivo.criar("Maria Souza", horas).salario_total()
+
+def test_vendedor_comissao_escalonada_via_fabrica():
+    class VendedorSenior(Vendedor):
+        FAIXAS_COMISSAO = TabelaFaixas([(0, '0.03'), (10000, '0.05'), (50000, '0.08')])
+        FAIXAS_BONUS_VENDAS = TabelaFaixas([(20000, 300), (50000, 1000)], progressiva=False)
+
+    FabricaFuncionario.registrar_tipo("vendedor_senior", VendedorSenior)
+    vendedor = FabricaFuncionario.criar("vendedor_senior", "Carlos Lima", 100, vendas="60000")
+    # 100 * 15 + 3100 de comissão + 1000 de bônus
+    assert vendedor.salario_total() == Decimal('5600.00')
+    assert vendedor.to_dict()['faixas_comissao'] == [[0.0, 0.03], [10000.0, 0.05], [50000.0, 0.08]]
+
 # ---------- Testes de Freelancer ----------
 
 def test_freelancer_salario_sem_bonus_horas():
@@ -276,6 +373,62 @@ def test_fabrica_registrar_tipo_personalizado():
     # salário total inclui bônus de férias 123.00
     assert instancia.salario_total() == (Decimal('10.00') + Decimal('123.00')).quantize(Decimal('0.01'))
 
+def test_fabrica_tipo_personalizado_com_campo_obrigatorio(caplog):
+    """Campos extras sem valor padrão no construtor passam a ser exigidos pela fábrica."""
+    class Consultor(Funcionario):
+        def __init__(self, nome: str, horas: int, diaria: Any, ferias: bool = False):
+            super().__init__(nome, horas, ferias)
+            self.diaria = Decimal(str(diaria))
+
+        @property
+        def _bonus_ferias(self) -> Decimal:
+            return Decimal('0.00')
+
+        def salario_mensal(self) -> Decimal:
+            return self.diaria * Decimal(self.horas // 8)
+
+    FabricaFuncionario.registrar_tipo("consultor", Consultor)
+    caplog.set_level("ERROR")
+    assert FabricaFuncionario.criar("consultor", "Rita Alves", 80) is None
+    assert "É obrigatório informar 'diaria' para Consultor" in caplog.text
+
+    consultor = FabricaFuncionario.criar("consultor", "Rita Alves", 80, diaria="450.00")
+    assert consultor.salario_mensal() == Decimal('4500.00')
+
+def test_fabrica_entradas_nativas_equivalem_a_assinatura():
+    """As entradas declaradas por extenso batem com as inferidas dos construtores."""
+    for nome, classe in (('estagiario', Estagiario), ('efetivo', Efetivo),
+                         ('vendedor', Vendedor), ('freelancer', Freelancer)):
+        assert FabricaFuncionario._despacho[nome] == funcionarios._montar_entrada(classe)
+
+def test_fabrica_ignora_parametros_somente_posicionais():
+    class Avulso(Estagiario):
+        def __init__(self, nome, horas, codigo=None, /, ferias=False, *, turno: str = "dia"):
+            super().__init__(nome, horas, ferias)
+
+    entrada = funcionarios._montar_entrada(Avulso)
+    assert entrada.campos_obrigatorios == ()
+    assert entrada.campos_aceitos == frozenset({'turno'})
+
+def test_fabrica_registro_concorrente_mantem_todos_os_tipos():
+    """Registros simultâneos não se perdem e leitores sempre veem tipos nativos."""
+    class Temporario(Estagiario):
+        pass
+
+    def registrar(indice):
+        FabricaFuncionario.registrar_tipo(f"temporario_{indice}", Temporario)
+        assert isinstance(FabricaFuncionario.criar("efetivo", "Maria Souza", 10), Efetivo)
+
+    threads = [threading.Thread(target=registrar, args=(i,)) for i in range(32)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    tipos = FabricaFuncionario.tipos_registrados()
+    assert all(f"temporario_{i}" in tipos for i in range(32))
+    assert isinstance(FabricaFuncionario.criar("temporario_7", "Ana Costa", 10), Temporario)
+
 def test_fabrica_cria_tipos_nativos_corretamente():
     """Verifica que a fábrica cria instâncias corretas para os tipos padrão."""
     est = FabricaFuncionario.criar("estagiario", "João Silva", 50)
@@ -295,6 +448,60 @@ def test_fabrica_cria_tipos_nativos_corretamente():
     assert freel.projetos == 2
 
 
+# ---------- Testes de Validação sem Exceções ----------
+
+def test_validar_e_criar_retorna_erros_de_todos_os_campos():
+    """Modo de validação retorna registros de erro sem lançar exceções."""
+    funcionario, erros = FabricaFuncionario.validar_e_criar("vendedor", "   ", -5, vendas="abc")
+    assert funcionario is None
+    assert [(e.campo, e.codigo) for e in erros] == [
+        ('nome', 'vazio'),
+        ('horas', 'negativo'),
+        ('vendas', 'nao_numerico'),
+    ]
+    assert erros[1].mensagem == "Horas trabalhadas não podem ser negativas"
+
+def test_validar_e_criar_campo_obrigatorio_e_tipo_invalido():
+    _, erros = FabricaFuncionario.validar_e_criar("freelancer", "Ana Costa", 10)
+    assert erros == [ErroValidacao('projetos', 'obrigatorio', "É obrigatório informar 'projetos' para Freelancer")]
+
+    _, erros = FabricaFuncionario.validar_e_criar("gerente", "Ana Costa", 10)
+    assert erros[0].codigo == 'tipo_invalido'
+
+def test_vendas_infinitas_sao_rejeitadas():
+    for vendas in ('Infinity', float('inf'), '-Infinity', 'NaN'):
+        _, erros = FabricaFuncionario.validar_e_criar("vendedor", "Carlos Lima", 10, vendas=vendas)
+        assert [(e.campo, e.codigo) for e in erros] == [('vendas', 'nao_numerico')]
+    resultado = FabricaFuncionario.criar_lote([{'tipo': 'vendedor', 'nome': 'Carlos Lima', 'horas': 10, 'vendas': 'Infinity'}])
+    assert resultado.funcionarios == []
+    assert resultado.estatisticas[('vendas', 'nao_numerico')] == 1
+
+def test_validar_e_criar_valido():
+    funcionario, erros = FabricaFuncionario.validar_e_criar("freelancer", "ana costa", 120.0, projetos=3)
+    assert erros == []
+    assert isinstance(funcionario, Freelancer)
+    assert funcionario.salario_total() == Decimal('1000.00')
+
+def test_criar_lote_agrega_estatisticas_e_registra_um_resumo(caplog):
+    """O lote registra um único resumo no log em vez de uma linha por erro."""
+    caplog.set_level("WARNING")
+    linhas = [
+        {'tipo': 'estagiario', 'nome': 'João Silva', 'horas': 160},
+        {'tipo': 'estagiario', 'nome': 'João Silva', 'horas': -1},
+        {'tipo': 'efetivo', 'nome': 'Maria Souza', 'horas': 10.5},
+        {'tipo': 'vendedor', 'nome': 'Carlos Lima', 'horas': -2},
+        {'tipo': 'gerente', 'nome': 'Teste', 'horas': 0},
+    ]
+    resultado = FabricaFuncionario.criar_lote(linhas)
+    assert len(resultado.funcionarios) == 1
+    assert resultado.linhas_invalidas == 4
+    assert resultado.estatisticas[('horas', 'negativo')] == 2
+    assert resultado.estatisticas[('vendas', 'obrigatorio')] == 1
+    assert resultado.estatisticas[('tipo', 'tipo_invalido')] == 1
+    assert [indice for indice, _ in resultado.erros] == [1, 2, 3, 3, 4]
+    assert len(caplog.records) == 1
+    assert "4 de 5 linhas inválidas" in caplog.text
+
 # ---------- Testes de Relatórios ----------
 
 def test_relatorio_texto_formatacao_estagiario():
@@ -383,8 +590,699 @@ def test_relatorio_json_freelancer_valido():
     assert 'salario_total' in dados
 
 
+def _roster_consolidado():
+    return [
+        Efetivo.criar("Maria Souza", 200, ferias=True),  # 3600 + 500 + 1000
+        Efetivo.criar("Paulo Reis", 100),  # 2000
+        Vendedor.criar("Carlos Lima", 80, vendas=20000.0),  # 1200 + 1000 + 500
+        Freelancer.criar("Ana Costa", 120, projetos=3),  # 1000
+        None,
+    ]
+
+def test_relatorio_consolidado_json():
+    dados = json.loads(RelatorioConsolidado(formato="json").gerar_consolidado(_roster_consolidado()))
+    assert list(dados) == ['Efetivo', 'Freelancer', 'Vendedor', 'TOTAL']
+    assert dados['Efetivo'] == {
+        'funcionarios': 2, 'horas_extras': 20, 'salario_total': 7100.0,
+        'bonus_ferias': 1000.0, 'comissoes': 0.0, 'bonus_vendas': 0.0
+    }
+    assert dados['Vendedor']['comissoes'] == 1000.0
+    assert dados['Vendedor']['bonus_vendas'] == 500.0
+    assert dados['TOTAL']['funcionarios'] == 4
+    assert dados['TOTAL']['salario_total'] == 10800.0
+
+def test_relatorio_consolidado_texto_e_interface():
+    relatorio = RelatorioConsolidado()
+    texto = relatorio.gerar_consolidado(_roster_consolidado())
+    assert texto.startswith("RELATÓRIO CONSOLIDADO DA FOLHA")
+    assert "Efetivo: 2 funcionário(s)" in texto
+    assert "  Horas extras: 20h" in texto
+    assert "Total geral: 4 funcionário(s)" in texto
+    assert "  Salários: R$ 10.800,00" in texto
+    # Como Relatorio, também resume um único funcionário
+    assert "Freelancer: 1 funcionário(s)" in relatorio.gerar(Freelancer.criar("Ana Costa", 120, projetos=3))
+    with pytest.raises(ValueError, match="Formato de relatório desconhecido"):
+        RelatorioConsolidado(formato="xml")
+
+def test_horas_extras_seguem_faixas_horas():
+    """Com FAIXAS_HORAS, as horas extras são as pagas acima da tarifa da primeira faixa."""
+    class EfetivoEscalonado(Efetivo):
+        FAIXAS_HORAS = TabelaFaixas([(0, '20'), (160, '30'), (200, '40')])
+
+    class EfetivoTarifaUnica(Efetivo):
+        FAIXAS_HORAS = TabelaFaixas([(0, '20'), (300, '20')])
+
+    class EfetivoMeiaHora(Efetivo):
+        FAIXAS_HORAS = TabelaFaixas([(0, '20'), ('170.5', '25')])
+
+    escalonado = EfetivoEscalonado.criar("Maria Souza", 210)
+    assert escalonado.horas_extras() == 50
+    assert escalonado.salario_mensal() == 160 * 20 + 40 * 30 + 10 * 40
+    assert EfetivoEscalonado.criar("Paulo Reis", 150).horas_extras() == 0
+    assert EfetivoTarifaUnica.criar("Paulo Reis", 310).horas_extras() == 0
+    assert EfetivoMeiaHora.criar("Paulo Reis", 180).horas_extras() == Decimal('9.5')
+
+    dados = json.loads(RelatorioConsolidado(formato="json").gerar_consolidado([escalonado]))
+    assert dados['EfetivoEscalonado']['horas_extras'] == 50
+
+def test_relatorio_consolidado_com_descontos():
+    consolidado = RelatorioConsolidado(descontos=_pipeline_descontos()).consolidar(_roster_consolidado())
+    total = consolidado['TOTAL']
+    assert total['salario_total'] - total['descontos'] == total['salario_liquido']
+    assert total['descontos'] > 0
+
+def test_relatorio_consolidado_nao_retem_funcionarios():
+    """O roster é consumido uma vez e nenhum funcionário é mantido vivo."""
+    referencias = []
+
+    def gerar():
+        for linha in gerar_roster_sintetico(50):
+            funcionario = FabricaFuncionario.criar(**linha)
+            referencias.append(weakref.ref(funcionario))
+            yield funcionario
+
+    consolidado = RelatorioConsolidado().consolidar(gerar())
+    assert consolidado['TOTAL']['funcionarios'] == 50
+    assert all(ref() is None for ref in referencias)
+
 # ---------- Testes de Métodos Abstratos ----------
 
 def test_instanciar_funcionario_direto_lanca_type_error():
     with pytest.raises(TypeError):
         Funcionario("Nome Teste", 100)
+
+
+# ---------- Testes de Perfil de Memória ----------
+
+def test_gerar_roster_sintetico_reprodutivel():
+    linhas = gerar_roster_sintetico(8, semente=1)
+    assert linhas == gerar_roster_sintetico(8, semente=1)
+    assert [linha['tipo'] for linha in linhas[:4]] == ['estagiario', 'efetivo', 'vendedor', 'freelancer']
+    assert len(FabricaFuncionario.criar_lote(linhas).funcionarios) == 8
+
+def test_perfilar_memoria_por_tipo_e_etapa():
+    perfil = perfilar_memoria(40, top=3)
+    assert set(perfil.bytes_por_tipo) == {'Estagiario', 'Efetivo', 'Vendedor', 'Freelancer'}
+    assert all(valor > 0 for valor in perfil.bytes_por_tipo.values())
+    assert [etapa for etapa, _, _ in perfil.etapas] == [
+        'fabrica', 'calculo', 'to_dict', 'relatorio_texto', 'relatorio_json'
+    ]
+    assert all(pico >= retido for _, retido, pico in perfil.etapas)
+    assert len(perfil.principais_alocacoes) <= 3
+    assert "PERFIL DE MEMÓRIA (40 funcionários)" in perfil.formatar()
+
+
+# ---------- Testes de Estatísticas Salariais ----------
+
+def test_esboco_quantis_respeita_erro_relativo():
+    valores = [float(v) for v in range(1, 10001)]
+    esboco = EsbocoQuantis(alpha=0.01)
+    for valor in valores:
+        esboco.adicionar(valor)
+    for q in (0.5, 0.9, 0.99):
+        exato = valores[int(q * (len(valores) - 1))]
+        assert abs(esboco.quantil(q) - exato) <= 0.01 * exato
+
+def test_esboco_quantis_zeros_vazio_e_negativos():
+    esboco = EsbocoQuantis()
+    assert esboco.quantil(0.5) is None
+    esboco.adicionar(0)
+    esboco.adicionar(0)
+    esboco.adicionar(100)
+    assert esboco.quantil(0.5) == 0.0
+    with pytest.raises(ValueError):
+        esboco.adicionar(-1)
+
+def test_esboco_quantis_memoria_limitada():
+    esboco = EsbocoQuantis(alpha=0.01, max_baldes=50)
+    for expoente in range(0, 600):
+        esboco.adicionar(1.05 ** expoente)
+    assert len(esboco._baldes) <= 50
+    assert esboco.quantil(1.0) == pytest.approx(1.05 ** 599, rel=0.01)
+
+def test_estatisticas_salariais_por_tipo():
+    funcionarios = FabricaFuncionario.criar_lote(gerar_roster_sintetico(400, semente=3)).funcionarios
+    resumo = EstatisticasSalariais().adicionar_todos(funcionarios).resumo()
+    assert list(resumo) == ['Efetivo', 'Estagiario', 'Freelancer', 'Vendedor']
+
+    salarios = sorted(f.salario_total() for f in funcionarios if isinstance(f, Vendedor))
+    vendedor = resumo['Vendedor']
+    assert vendedor['contagem'] == len(salarios) == 100
+    assert vendedor['total'] == sum(salarios)
+    assert vendedor['minimo'] == salarios[0]
+    assert vendedor['maximo'] == salarios[-1]
+    assert vendedor['media'] == (sum(salarios) / 100).quantize(Decimal('0.01'))
+    assert math.isclose(vendedor['desvio_padrao'], statistics.pstdev(float(v) for v in salarios))
+    p90 = float(salarios[int(0.9 * 99)])
+    assert abs(vendedor['p90'] - p90) <= 0.01 * p90
+
+def test_estatisticas_salariais_valor_invalido_nao_altera_acumulador():
+    class Ajuste:
+        def __init__(self, valor):
+            self.valor = Decimal(valor)
+        def salario_total(self):
+            return self.valor
+
+    estatisticas = EstatisticasSalariais()
+    estatisticas.adicionar(Ajuste('100.00'))
+    for invalido in ('-50.00', 'Infinity', 'NaN'):
+        with pytest.raises(ValueError):
+            estatisticas.adicionar(Ajuste(invalido))
+    estatisticas.adicionar(Ajuste('300.00'))
+
+    resumo = estatisticas.resumo()['Ajuste']
+    assert resumo['contagem'] == 2
+    assert resumo['total'] == Decimal('400.00')
+    assert resumo['minimo'] == Decimal('100.00')
+    assert resumo['maximo'] == Decimal('300.00')
+    assert resumo['media'] == Decimal('200.00')
+    assert math.isclose(resumo['desvio_padrao'], 100.0)
+    assert estatisticas._por_tipo['Ajuste'].esboco.contagem == 2
+
+def test_estatisticas_salariais_mesclar_shards_igual_passada_unica():
+    funcionarios = FabricaFuncionario.criar_lote(gerar_roster_sintetico(300, semente=5)).funcionarios
+    unica = EstatisticasSalariais().adicionar_todos(funcionarios).resumo()
+
+    shards = [EstatisticasSalariais().adicionar_todos(funcionarios[i::3]) for i in range(3)]
+    # Simula o envio entre processos
+    shards = [pickle.loads(pickle.dumps(shard)) for shard in shards]
+    mesclado = shards[0].mesclar(shards[1]).mesclar(shards[2]).resumo()
+
+    for tipo, esperado in unica.items():
+        obtido = mesclado[tipo]
+        for chave in ('contagem', 'total', 'media', 'minimo', 'maximo', 'p50', 'p90', 'p99'):
+            assert obtido[chave] == esperado[chave]
+        assert math.isclose(obtido['desvio_padrao'], esperado['desvio_padrao'])
+
+
+# ---------- Testes de Exportação de Holerites ----------
+
+def _roster(tamanho):
+    return FabricaFuncionario.criar_lote(gerar_roster_sintetico(tamanho, semente=7)).funcionarios
+
+def test_exportar_holerites_zip_ordenado_e_retomavel(tmp_path):
+    funcionarios = _roster(25)
+    destino = str(tmp_path / "holerites.zip")
+
+    assert exportar_holerites(funcionarios[:10], destino, tamanho_lote=3, max_lotes_em_voo=2) == 10
+    # Retomada: só os 15 restantes são gravados
+    assert exportar_holerites(funcionarios, destino, tamanho_lote=3, max_lotes_em_voo=2) == 15
+
+    with zipfile.ZipFile(destino) as arquivo:
+        nomes = arquivo.namelist()
+        assert nomes == sorted(nomes)
+        assert nomes[0] == "00000000_funcionario_0.txt"
+        assert arquivo.read(nomes[24]).decode('utf-8') == RelatorioTexto().gerar(funcionarios[24])
+
+def test_exportar_holerites_tar_json(tmp_path):
+    funcionarios = _roster(6)
+    destino = str(tmp_path / "holerites.tar")
+    assert exportar_holerites(funcionarios, destino, relatorio=RelatorioJSON(), trabalhadores=2) == 6
+    with tarfile.open(destino) as arquivo:
+        membros = arquivo.getmembers()
+        assert [m.name for m in membros][-1] == "00000005_funcionario_5.json"
+        dados = json.loads(arquivo.extractfile(membros[2]).read())
+        assert dados['tipo'] == "Vendedor"
+
+def test_exportar_holerites_diretorios_fragmentados(tmp_path):
+    funcionarios = _roster(10)
+    destino = str(tmp_path / "holerites")
+    assert exportar_holerites(funcionarios, destino, por_diretorio=4) == 10
+    assert sorted(os.listdir(destino)) == ['00000', '00001', '00002']
+    assert sorted(os.listdir(os.path.join(destino, '00002'))) == [
+        "00000008_funcionario_8.txt", "00000009_funcionario_9.txt"
+    ]
+    assert exportar_holerites(funcionarios, destino, por_diretorio=4) == 0
+
+def test_exportar_holerites_diretorio_ignora_arquivos_alheios(tmp_path):
+    funcionarios = _roster(6)
+    destino = tmp_path / "holerites"
+    destino.mkdir()
+    (destino / "LEIAME.txt").write_text("holerites de março", encoding='utf-8')
+    (destino / ".DS_Store").write_bytes(b"")
+    assert exportar_holerites(funcionarios[:3], str(destino), por_diretorio=4) == 3
+    # Os arquivos alheios não deslocam o ponto de retomada
+    assert exportar_holerites(funcionarios, str(destino), por_diretorio=4) == 3
+    assert sorted(os.listdir(destino / "00001")) == ["00000004_funcionario_4.txt", "00000005_funcionario_5.txt"]
+
+def test_exportar_holerites_ignora_none(tmp_path):
+    funcionarios = _roster(4)
+    com_falhas = [None, funcionarios[0], funcionarios[1], None, funcionarios[2], funcionarios[3]]
+    destino = str(tmp_path / "holerites.zip")
+    assert exportar_holerites(com_falhas[:3], destino) == 2
+    assert exportar_holerites(com_falhas, destino) == 2
+    with zipfile.ZipFile(destino) as arquivo:
+        conteudos = [arquivo.read(nome) for nome in arquivo.namelist()]
+    assert conteudos == [RelatorioTexto().gerar(f).encode('utf-8') for f in funcionarios]
+
+def test_exportar_holerites_pool_de_processos(tmp_path):
+    funcionarios = _roster(8)
+    destino = str(tmp_path / "holerites.zip")
+    assert exportar_holerites(funcionarios, destino, usar_processos=True, trabalhadores=2, tamanho_lote=2) == 8
+    with zipfile.ZipFile(destino) as arquivo:
+        assert len(arquivo.namelist()) == 8
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGKILL'), reason="requer SIGKILL")
+@pytest.mark.parametrize("extensao", ["zip", "tar"])
+def test_exportar_holerites_retoma_apos_sigkill(tmp_path, extensao):
+    """Uma exportação morta no meio (ex: pelo OOM killer) é retomada sem perdas nem duplicatas."""
+    destino = str(tmp_path / f"holerites.{extensao}")
+    codigo = (
+        "import os, signal\n"
+        "from funcionarios import FabricaFuncionario, exportar_holerites, gerar_roster_sintetico\n"
+        "funcionarios = FabricaFuncionario.criar_lote(gerar_roster_sintetico(300, semente=7)).funcionarios\n"
+        "def gerar():\n"
+        "    for i, f in enumerate(funcionarios):\n"
+        "        if i == 200:\n"
+        "            os.kill(os.getpid(), signal.SIGKILL)\n"
+        "        yield f\n"
+        f"exportar_holerites(gerar(), {destino!r}, tamanho_lote=8, max_lotes_em_voo=2)\n"
+    )
+    ambiente = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(funcionarios.__file__)))
+    processo = subprocess.run([sys.executable, '-c', codigo], cwd=str(tmp_path), env=ambiente)
+    assert processo.returncode == -signal.SIGKILL
+    if extensao == "zip":
+        assert not zipfile.is_zipfile(destino)
+
+    roster = _roster(300)
+    gravados = exportar_holerites(roster, destino, tamanho_lote=8)
+    # Os holerites completos antes da morte são aproveitados
+    assert 100 <= gravados < 300
+
+    relatorio = RelatorioTexto()
+    if extensao == "zip":
+        with zipfile.ZipFile(destino) as arquivo:
+            assert arquivo.testzip() is None
+            nomes = arquivo.namelist()
+            conteudos = [arquivo.read(nome) for nome in nomes]
+    else:
+        with tarfile.open(destino) as arquivo:
+            nomes = arquivo.getnames()
+            conteudos = [arquivo.extractfile(nome).read() for nome in nomes]
+    assert nomes == [f"{i:08d}_funcionario_{roster[i].nome.split()[-1]}.txt" for i in range(300)]
+    assert conteudos == [relatorio.gerar(f).encode('utf-8') for f in roster]
+
+def test_exportar_holerites_formato_invalido(tmp_path):
+    with pytest.raises(ValueError, match="Formato de exportação desconhecido"):
+        exportar_holerites([], str(tmp_path / "x"), formato="rar")
+
+
+# ---------- Testes de Importação ----------
+
+def _rodar_python(codigo, cwd):
+    ambiente = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(funcionarios.__file__)))
+    return subprocess.run(
+        [sys.executable, '-c', codigo], cwd=cwd, env=ambiente,
+        capture_output=True, text=True, check=True
+    ).stdout
+
+def test_importacao_sem_efeitos_colaterais(tmp_path):
+    """Importar o módulo não cria arquivo de log nem carrega módulos pouco usados."""
+    saida = _rodar_python(
+        "import sys, funcionarios; "
+        "print(sorted(m for m in ('json', 'logging', 'inspect', 'random') if m in sys.modules))",
+        tmp_path
+    )
+    assert saida.strip() == "[]"
+    assert os.listdir(tmp_path) == []
+
+def test_configurar_logging_explicito(tmp_path):
+    _rodar_python(
+        "import funcionarios; "
+        "funcionarios.configurar_logging(console=False); "
+        "funcionarios.FabricaFuncionario.criar('gerente', 'Teste', 10)",
+        tmp_path
+    )
+    conteudo = (tmp_path / "funcionarios.log").read_text(encoding='utf-8')
+    assert "Tipo de funcionário não registrado: 'gerente'" in conteudo
+
+
+# ---------- Testes de Descontos ----------
+
+# Tabelas de 2024 usadas apenas como exemplo
+TABELA_INSS = TabelaFaixas([(0, '0.075'), ('1412.00', '0.09'), ('2666.68', '0.12'), ('4000.03', '0.14')])
+TABELA_IRRF = TabelaFaixas([(0, 0), ('2259.20', '0.075'), ('2826.65', '0.15'), ('3751.05', '0.225'), ('4664.68', '0.275')])
+
+def _pipeline_descontos():
+    return DescontosFolha([
+        ContribuicaoProgressiva("INSS", TABELA_INSS, teto='7786.02'),
+        DeducaoDependentes('189.59'),
+        ImpostoProgressivo("IRRF", TABELA_IRRF),
+        DescontoFixo("Plano de saúde", '150.00'),
+    ])
+
+def test_descontos_passada_unica():
+    efetivo = Efetivo.criar("Maria Souza", 236)  # 180 * 20 + 56 * 25 = 5000
+    resultado = _pipeline_descontos().calcular(efetivo, dependentes=1)
+    assert resultado.bruto == Decimal('5000.00')
+    assert resultado.descontos == [
+        ("INSS", Decimal('518.82')),
+        ("IRRF", Decimal('302.84')),
+        ("Plano de saúde", Decimal('150.00')),
+    ]
+    assert resultado.liquido == Decimal('4028.34')
+
+def test_descontos_teto_e_dependentes_do_funcionario():
+    pipeline = _pipeline_descontos()
+    acima_do_teto = Efetivo.criar("Maria Souza", 400)
+    acima_do_teto.dependentes = 2
+    inss = dict(pipeline.calcular(acima_do_teto).descontos)["INSS"]
+    assert inss == Decimal('908.86')
+    sem_dependentes = pipeline.calcular(acima_do_teto, dependentes=0)
+    assert dict(sem_dependentes.descontos)["IRRF"] > dict(pipeline.calcular(acima_do_teto).descontos)["IRRF"]
+
+def test_descontos_lote_igual_passada_unica():
+    pipeline = _pipeline_descontos()
+    funcionarios = _roster(40)
+    dependentes = [i % 3 for i in range(40)]
+    esperado = [pipeline.calcular(f, d) for f, d in zip(funcionarios, dependentes)]
+    assert pipeline.calcular_lote(funcionarios, dependentes) == esperado
+
+def test_descontos_lote_dependentes_de_tamanho_diferente():
+    funcionarios = _roster(3)
+    with pytest.raises(ValueError, match="'dependentes' tem 1 itens para 3 funcionários"):
+        _pipeline_descontos().calcular_lote(funcionarios, [0])
+
+def test_desconto_fixo_limitado_ao_liquido():
+    pipeline = _pipeline_descontos()
+    sem_horas = Estagiario.criar("João Silva", 0)
+    assert pipeline.calcular(sem_horas).liquido == Decimal('0.00')
+    assert dict(pipeline.calcular(sem_horas).descontos)["Plano de saúde"] == Decimal('0.00')
+    pouco = Estagiario.criar("João Silva", 10)  # 100.00 - 7.50 de INSS
+    assert pipeline.calcular(pouco).descontos[-1] == ("Plano de saúde", Decimal('92.50'))
+    assert pipeline.calcular_lote([sem_horas, pouco]) == [pipeline.calcular(sem_horas), pipeline.calcular(pouco)]
+
+def test_descontos_nomes_de_etapa_repetidos():
+    with pytest.raises(ValueError, match="Nomes de etapa repetidos: Plano"):
+        DescontosFolha([DescontoFixo("Plano", '100.00'), DescontoFixo("Plano", '50.00')])
+
+def test_relatorios_com_descontos():
+    efetivo = Efetivo.criar("Maria Souza", 236)
+    texto = RelatorioTexto(descontos=_pipeline_descontos()).gerar(efetivo)
+    assert "INSS: -R$ 518,82" in texto
+    assert "Plano de saúde: -R$ 150,00" in texto
+    assert "Salário líquido: R$ 3.985,68" in texto
+
+    dados = json.loads(RelatorioJSON(descontos=_pipeline_descontos()).gerar(efetivo))
+    assert dados['descontos'] == {"INSS": 518.82, "IRRF": 345.5, "Plano de saúde": 150.0}
+    assert dados['salario_liquido'] == 3985.68
+    # Sem pipeline o relatório não muda
+    assert 'salario_liquido' not in json.loads(RelatorioJSON().gerar(efetivo))
+
+
+# ---------- Testes de Folha Incremental ----------
+
+def _folha_inicial():
+    return FolhaIncremental([
+        Efetivo.criar("Maria Souza", 160),
+        Vendedor.criar("Carlos Lima", 100, vendas="5000"),
+        Freelancer.criar("Ana Costa", 50, projetos=2),
+    ])
+
+def test_folha_incremental_aplica_eventos_pelos_setters():
+    folha = _folha_inicial()
+    assert folha.total == Decimal('3200.00') + Decimal('1750.00') + Decimal('600.00')
+
+    assert folha.aplicar_evento({'evento': 'horas', 'nome': 'maria souza', 'horas': 30.0}) is None
+    assert folha.aplicar_evento({'evento': 'vendas', 'nome': 'Carlos Lima', 'vendas': '6000.00'}) is None
+    assert folha.aplicar_evento({'evento': 'projeto', 'nome': 'Ana Costa'}) is None
+    assert folha.aplicar_evento({'evento': 'ferias', 'nome': 'Maria Souza'}) is None
+
+    assert folha.funcionarios['Maria Souza'].horas == 190
+    assert folha.funcionarios['Maria Souza'].ferias is True
+    assert folha.funcionarios['Ana Costa'].projetos == 3
+    assert folha.total == sum(f.salario_total() for f in folha.funcionarios.values())
+    assert folha.totais_por_tipo['Vendedor'] == folha.funcionarios['Carlos Lima'].salario_total()
+    assert folha.eventos_aplicados == 4
+
+def test_folha_incremental_erros_estruturados():
+    folha = _folha_inicial()
+    total = folha.total
+    assert folha.aplicar_evento({'evento': 'horas', 'nome': 'Maria Souza', 'horas': -5}).codigo == 'negativo'
+    assert folha.aplicar_evento({'evento': 'vendas', 'nome': 'Ana Costa', 'vendas': 10}).codigo == 'nao_suportado'
+    assert folha.aplicar_evento({'evento': 'horas', 'nome': 'Fulano', 'horas': 1}).codigo == 'funcionario_desconhecido'
+    assert folha.aplicar_evento({'evento': 'demissao', 'nome': 'Ana Costa'}).codigo == 'evento_invalido'
+    assert folha.total == total
+    assert folha.eventos_aplicados == 0
+    assert sum(folha.erros.values()) == 4
+
+def test_folha_incremental_evento_invalido_nao_altera_funcionario():
+    folha = _folha_inicial()
+    total = folha.total
+    erro = folha.aplicar_evento(json.loads('{"evento": "vendas", "nome": "Carlos Lima", "vendas": Infinity}'))
+    assert erro is not None
+    assert folha.funcionarios['Carlos Lima'].vendas == Decimal('5000')
+    assert folha.funcionarios['Carlos Lima'].salario_total() == Decimal('1750.00')
+    assert folha.total == total
+    # A folha continua aceitando eventos
+    assert folha.aplicar_evento({'evento': 'vendas', 'nome': 'Carlos Lima', 'vendas': '100'}) is None
+    assert folha.total == sum(f.salario_total() for f in folha.funcionarios.values())
+
+def test_folha_incremental_admissao():
+    folha = _folha_inicial()
+    erro = folha.aplicar_evento({'evento': 'admissao', 'tipo': 'estagiario', 'nome': 'joão silva', 'horas': 100})
+    assert erro is None
+    snapshot = folha.snapshot()
+    assert snapshot['funcionarios'] == 4
+    assert snapshot['por_tipo']['Estagiario'] == {'funcionarios': 1, 'total': Decimal('1000.00')}
+
+def test_folha_incremental_admissao_nome_repetido():
+    folha = _folha_inicial()
+    original = folha.funcionarios['Maria Souza']
+    total = folha.total
+    erro = folha.aplicar_evento({'evento': 'admissao', 'tipo': 'estagiario', 'nome': 'maria souza', 'horas': 100})
+    assert (erro.campo, erro.codigo) == ('nome', 'duplicado')
+    assert folha.funcionarios['Maria Souza'] is original
+    assert folha.total == total
+    assert folha.erros[('nome', 'duplicado')] == 1
+    # A substituição continua disponível de forma explícita
+    folha.adicionar(FabricaFuncionario.criar(tipo='estagiario', nome='Maria Souza', horas=100))
+    assert type(folha.funcionarios['Maria Souza']).__name__ == 'Estagiario'
+    assert folha.total == sum(f.salario_total() for f in folha.funcionarios.values())
+
+def test_acompanhar_eventos_ate_o_fim(tmp_path):
+    caminho = tmp_path / "eventos.jsonl"
+    eventos = [
+        {'evento': 'horas', 'nome': 'Maria Souza', 'horas': 20},
+        {'evento': 'vendas', 'nome': 'Carlos Lima', 'vendas': '1000'},
+    ]
+    caminho.write_text("\n".join(json.dumps(e) for e in eventos) + "\nnão é json\n", encoding='utf-8')
+    folha = _folha_inicial()
+    snapshots = []
+    assert acompanhar_eventos(str(caminho), folha, snapshots.append, seguir=False) == 3
+    assert len(snapshots) == 1
+    assert snapshots[0]['eventos_aplicados'] == 2
+    assert snapshots[0]['erros'] == 1
+    assert snapshots[0]['eventos_por_segundo'] > 0
+
+def test_acompanhar_eventos_seguindo_arquivo(tmp_path):
+    """Linhas acrescentadas depois (inclusive em pedaços) são aplicadas até o sinal de parada."""
+    caminho = tmp_path / "eventos.jsonl"
+    caminho.write_text("", encoding='utf-8')
+    folha = _folha_inicial()
+    snapshots = []
+    parar = threading.Event()
+    thread = threading.Thread(target=acompanhar_eventos, args=(str(caminho), folha, snapshots.append),
+                              kwargs={'intervalo_leitura': 0.01, 'parar': parar})
+    thread.start()
+    with open(caminho, 'a', encoding='utf-8') as arquivo:
+        arquivo.write('{"evento": "horas", "nome": "Maria ')
+        arquivo.flush()
+        arquivo.write('Souza", "horas": 10}\n')
+        arquivo.write('{"evento": "projeto", "nome": "Ana Costa", "projetos": 2}\n')
+    for _ in range(500):
+        if folha.eventos_aplicados == 2:
+            break
+        threading.Event().wait(0.01)
+    parar.set()
+    thread.join(timeout=5)
+    assert folha.funcionarios['Maria Souza'].horas == 170
+    assert folha.funcionarios['Ana Costa'].projetos == 4
+    assert snapshots[-1]['eventos_aplicados'] == 2
+
+def test_acompanhar_eventos_caractere_multibyte_dividido(tmp_path):
+    """Uma escrita interrompida no meio do "ã" não derruba a leitura."""
+    caminho = tmp_path / "eventos.jsonl"
+    caminho.write_bytes(b"")
+    folha = _folha_inicial()
+    parar = threading.Event()
+    thread = threading.Thread(target=acompanhar_eventos, args=(str(caminho), folha, lambda dados: None),
+                              kwargs={'intervalo_leitura': 0.01, 'parar': parar})
+    thread.start()
+    linha = json.dumps({'evento': 'admissao', 'tipo': 'estagiario', 'nome': 'João Silva', 'horas': 100},
+                       ensure_ascii=False).encode('utf-8') + b"\n"
+    corte = linha.index("ã".encode('utf-8')) + 1
+    with open(caminho, 'ab') as arquivo:
+        arquivo.write(linha[:corte])
+        arquivo.flush()
+        threading.Event().wait(0.1)
+        arquivo.write(linha[corte:])
+        arquivo.write(b'{"evento": "horas", "nome": "Jo\xc3\xa3o Silva", "horas": 10}\n')
+    for _ in range(500):
+        if folha.eventos_aplicados == 2:
+            break
+        threading.Event().wait(0.01)
+    parar.set()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert folha.funcionarios['João Silva'].horas == 110
+    assert sum(folha.erros.values()) == 0
+
+
+# ---------- Testes de Cálculo Colunar e Carga de CSV ----------
+
+CSV_ROSTER = """tipo,nome,horas,vendas,projetos,ferias
+estagiario,joão silva,160.0,,,sim
+efetivo,Maria Souza,200,,,
+vendedor,"Lima, Carlos",180,15000.00,,true
+freelancer,Ana Costa,120,,4.0,
+vendedor,Sem Vendas,10,,,
+efetivo,Meia Hora,10.5,,,
+
+gerente,Fulano,1,,,
+vendedor,Carlos Lima,50,abc,,
+"""
+
+def test_salario_total_lote_igual_ao_escalar():
+    class VendedorSenior(Vendedor):
+        FAIXAS_COMISSAO = TabelaFaixas([(0, '0.03'), (10000, '0.05'), (50000, '0.08')])
+
+    class EstagiarioPremium(Estagiario):
+        def salario_mensal(self) -> Decimal:
+            return super().salario_mensal() * 2
+
+    funcionarios = _roster(60) + [
+        VendedorSenior.criar("Carlos Lima", 10, vendas="60000", ferias=True),
+        EstagiarioPremium.criar("João Silva", 10, ferias=True),
+    ]
+    for classe in (Estagiario, Efetivo, Vendedor, Freelancer, VendedorSenior, EstagiarioPremium):
+        grupo = [f for f in funcionarios if type(f) is classe]
+        colunas = {'nome': [f.nome for f in grupo], 'horas': [f.horas for f in grupo],
+                   'ferias': [f.ferias for f in grupo]}
+        for campo in ('vendas', 'projetos'):
+            if hasattr(grupo[0], campo):
+                colunas[campo] = [getattr(f, campo) for f in grupo]
+        assert classe.salario_total_lote(colunas) == [f.salario_total() for f in grupo]
+
+def test_carregar_csv_colunar_semantica_dos_setters(tmp_path):
+    caminho = tmp_path / "roster.csv"
+    caminho.write_text(CSV_ROSTER, encoding='utf-8')
+    resultado = carregar_csv_colunar(str(caminho))
+    roster = resultado.roster
+
+    assert roster.nomes == ["João Silva", "Maria Souza", "Lima, Carlos", "Ana Costa"]
+    assert list(roster.horas) == [160, 200, 180, 120]
+    assert list(roster.ferias) == [1, 0, 1, 0]
+    assert roster.vendas[2] == Decimal('15000.00')
+    assert roster.projetos[3] == 4
+    assert roster.salarios_totais() == [f.salario_total() for f in roster.funcionarios()] == [
+        Decimal('1800.00'), Decimal('4100.00'), Decimal('4750.00'), Decimal('1300.00')
+    ]
+    assert [(linha, erro.codigo) for linha, erro in resultado.erros] == [
+        (6, 'obrigatorio'), (7, 'nao_inteiro'), (9, 'tipo_invalido'), (10, 'nao_numerico')
+    ]
+    assert resultado.estatisticas[('vendas', 'obrigatorio')] == 1
+
+def test_carregar_csv_colunar_ignora_extras_nao_aceitos(tmp_path):
+    """Mesma semântica de validar_e_criar: vendas de um estagiário é ignorada, não validada."""
+    caminho = tmp_path / "roster.csv"
+    caminho.write_text("tipo,nome,horas,vendas,projetos\n"
+                       "estagiario,João Silva,10,n/a,x\n"
+                       "vendedor,Carlos Lima,10,n/a,x\n", encoding='utf-8')
+    resultado = carregar_csv_colunar(str(caminho))
+    _, erros = FabricaFuncionario.validar_e_criar("estagiario", "João Silva", 10, vendas="n/a", projetos="x")
+    assert erros == []
+    assert resultado.roster.nomes == ["João Silva"]
+    assert resultado.roster.vendas == [None]
+    assert [(linha, erro.campo, erro.codigo) for linha, erro in resultado.erros] == [(3, 'vendas', 'nao_numerico')]
+
+def test_carregar_csv_colunar_horas_fora_do_intervalo(tmp_path):
+    caminho = tmp_path / "roster.csv"
+    caminho.write_text("tipo,nome,horas\n"
+                       "efetivo,Maria Souza,100000000000000000000\n"
+                       f"efetivo,Paulo Reis,{RosterColunar.MAX_HORAS}\n", encoding='utf-8')
+    resultado = carregar_csv_colunar(str(caminho))
+    assert [(linha, erro.codigo) for linha, erro in resultado.erros] == [(2, 'fora_do_intervalo')]
+    assert resultado.roster.nomes == ["Paulo Reis"]
+
+def test_carregar_csv_colunar_utf8_invalido_so_invalida_a_linha(tmp_path):
+    caminho = tmp_path / "roster.csv"
+    caminho.write_bytes(b"tipo,nome,horas\n"
+                        b"efetivo,Maria Souza,abc\n"
+                        b"efetivo,Jo\xe3o Silva,10\n"
+                        b"efetivo,Paulo Reis,10\n")
+    resultado = carregar_csv_colunar(str(caminho))
+    assert [(linha, erro.codigo) for linha, erro in resultado.erros] == [(2, 'nao_inteiro'), (3, 'csv_invalido')]
+    assert resultado.roster.nomes == ["Paulo Reis"]
+
+def test_carregar_csv_colunar_cabecalho_entre_aspas_e_campos_a_mais(tmp_path):
+    caminho = tmp_path / "roster.csv"
+    caminho.write_text('"tipo","nome","horas","vendas"\n'
+                       'vendedor,Carlos Lima,10,1,000\n'
+                       ',Maria Souza,10,\n'
+                       'vendedor,Carlos Lima,10,"1000.00"\n', encoding='utf-8')
+    resultado = carregar_csv_colunar(str(caminho))
+    assert [(linha, erro.campo, erro.codigo) for linha, erro in resultado.erros] == [
+        (2, 'linha', 'csv_invalido'), (3, 'tipo', 'obrigatorio')
+    ]
+    assert resultado.roster.nomes == ["Carlos Lima"]
+    assert resultado.roster.vendas == [Decimal('1000.00')]
+
+def test_carregar_csv_colunar_so_quebra_linhas_em_lf(tmp_path):
+    """Separadores Unicode dentro de um campo não deslocam a numeração das linhas."""
+    caminho = tmp_path / "roster.csv"
+    caminho.write_text(
+        "tipo,nome,horas\r\n"
+        "estagiario,Jo\x85o Silva,10\r\n"
+        "efetivo,Maria\u2028Souza,20\r\n"
+        "efetivo,Carlos\rLima,20\n"
+        "efetivo,Ana Costa,abc\n",
+        encoding='utf-8', newline=''
+    )
+    for tamanho_bloco in (1, 1024):
+        resultado = carregar_csv_colunar(str(caminho), tamanho_bloco=tamanho_bloco, trabalhadores=1)
+        assert len(resultado.roster) == 2
+        assert [(linha, erro.codigo) for linha, erro in resultado.erros] == [(4, 'csv_invalido'), (5, 'nao_inteiro')]
+
+def test_carregar_csv_colunar_blocos_paralelos_mantem_ordem(tmp_path):
+    caminho = tmp_path / "roster.csv"
+    linhas = gerar_roster_sintetico(200, semente=11)
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write("tipo,nome,horas,vendas,projetos,ferias\n")
+        for linha in linhas:
+            arquivo.write(f"{linha['tipo']},{linha['nome']},{linha['horas']},{linha.get('vendas', '')},"
+                          f"{linha.get('projetos', '')},{int(linha['ferias'])}\n")
+    esperado = [f.salario_total() for f in FabricaFuncionario.criar_lote(linhas).funcionarios]
+
+    for usar_processos in (False, True):
+        resultado = carregar_csv_colunar(str(caminho), trabalhadores=3, tamanho_bloco=512,
+                                         usar_processos=usar_processos)
+        assert resultado.erros == []
+        assert resultado.roster.salarios_totais() == esperado
+
+def test_carregar_csv_colunar_vazio(tmp_path):
+    caminho = tmp_path / "vazio.csv"
+    caminho.write_text("", encoding='utf-8')
+    assert len(carregar_csv_colunar(str(caminho)).roster) == 0
+
+
+# ---------- Testes de Paridade nos Casos Limite ----------
+
+def test_motores_v2_concordam_nos_casos_limite():
+    linhas = gerar_roster_casos_limite()
+    referencia = [FabricaFuncionario.criar(**linha).salario_total() for linha in linhas]
+
+    resultado = FabricaFuncionario.criar_lote(linhas)
+    assert resultado.erros == []
+    assert [f.salario_total() for f in resultado.funcionarios] == referencia
+
+    roster = RosterColunar()
+    for linha, funcionario in zip(linhas, resultado.funcionarios):
+        roster.anexar(linha['tipo'], funcionario.nome, funcionario.horas, funcionario.ferias,
+                      getattr(funcionario, 'vendas', None), getattr(funcionario, 'projetos', None))
+    assert roster.salarios_totais() == referencia
+
+def test_meio_centavo_arredonda_para_cima():
+    # Em float, 0.30 * 0.05 = 0.014999... e ":.2f" exibe 0.01; a v2 usa ROUND_HALF_UP
+    vendedor = FabricaFuncionario.criar(tipo="vendedor", nome="Carlos Lima", horas=180, vendas="0.30")
+    assert vendedor.salario_total() == Decimal('2700.02')